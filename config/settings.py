@@ -125,6 +125,30 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # gunicorn runs threaded workers (see dockerfile): take the write lock
+            # when a transaction starts instead of upgrading a read lock mid-way,
+            # and wait for a busy database instead of failing with "database is locked"
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
+    }
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# The anonymous index page cache, the cached unsold item count and the
+# confirmation email throttle are invalidated/checked through this cache, so it
+# must be shared by every gunicorn worker (WEB_CONCURRENCY > 1). Django's default
+# LocMemCache is per process and would let other workers serve stale pages.
+# A file-based cache is shared by all workers in the same container; a deployment
+# running several containers needs a network cache (e.g. Redis) instead.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("DJANGO_CACHE_DIR", BASE_DIR / ".django_cache"),
     }
 }
 
@@ -14,3 +14,17 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
+
+# Fill the ContentType cache for the likeable models once per worker, so the
+# first item detail page / like request after a (re)start doesn't pay for it.
+# Done here rather than in AppConfig.ready(), which also runs for management
+# commands (e.g. migrate on an empty database) where queries must not run.
+from django.db import DatabaseError  # noqa: E402
+from django.contrib.contenttypes.models import ContentType  # noqa: E402
+from market.signals import LIKEABLE_MODELS  # noqa: E402
+
+try:
+    ContentType.objects.get_for_models(*LIKEABLE_MODELS)
+except DatabaseError:
+    # Tables not migrated yet; the cache fills lazily on first use instead
+    pass
@@ -1,7 +1,9 @@
 from allauth.account.adapter import DefaultAccountAdapter
-from django.urls import reverse
 from django.conf import settings
 
+from market.middleware import PROFILE_COMPLETE_SESSION_KEY
+from market.utils import cached_reverse
+
 class CustomAccountAdapter(DefaultAccountAdapter):
     """
     Custom account adapter for django-allauth.
@@ -12,6 +14,11 @@ class CustomAccountAdapter(DefaultAccountAdapter):
         redirects to 'profile-set'.
     - Otherwise, redirects to 'home'.
     """
+
+    # Absolute logo URL injected into every email template.
+    # Read from settings once when the adapter class is loaded.
+    EMAIL_LOGO_URL = settings.EMAIL_LOGO_URL
+
     def _get_profile_or_home(self, request):
         """
         Helper method that chooses between the profile setup page and home.
@@ -26,14 +33,27 @@ class CustomAccountAdapter(DefaultAccountAdapter):
 
         # Anonymous users (should rarely happen here, but safe fallback)
         if not user.is_authenticated:
-            return reverse("home")
+            return cached_reverse("home")
 
-        # Profile considered incomplete if any of these fields are missing
-        if not user.nickname or not user.address or not user.city:
-            return reverse("profile-set")
+        # Profile considered incomplete if any of nickname, address or city is missing
+        # (cached on the user row as 'profile_complete')
+        if not user.profile_complete:
+            return cached_reverse("profile-set")
 
         # Profile is complete → go to home page
-        return reverse("home")
+        return cached_reverse("home")
+
+    def login(self, request, user):
+        """
+        Log the user in and flag complete profiles in the session.
+
+        - With the flag set, ProfileRequiredMiddleware can skip loading
+            the user from the DB from the very first request after login.
+        """
+        super().login(request, user)
+
+        if user.profile_complete:
+            request.session[PROFILE_COMPLETE_SESSION_KEY] = True
 
     def get_login_redirect_url(self, request):
         """
@@ -57,12 +77,12 @@ class CustomAccountAdapter(DefaultAccountAdapter):
         """
         Extend the default allauth send_mail behavior.
 
-        - Injects EMAIL_LOGO_URL from settings into the template context so
+        - Injects EMAIL_LOGO_URL (cached from settings) into the template context so
             that HTML email templates can render a static logo via {{ email_logo_url }}.
         """
 
         # Provide the absolute logo URL to every email template that uses this adapter.
-        context["email_logo_url"] = settings.EMAIL_LOGO_URL
+        context["email_logo_url"] = self.EMAIL_LOGO_URL
 
         # Delegate the actual email rendering and sending to the parent implementation.
         return super().send_mail(template_prefix, email, context)
@@ -3,11 +3,34 @@ from django.contrib import admin
 # Preconfigured admin class for user management (base class for User-like models)
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.contenttypes.admin import GenericTabularInline
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 
 # Import all Models from the current app
 from .models import User, PostItem, Comment, Like
 
 
+def with_liked_objects(queryset):
+    """
+    Load the relations shown for each Like (its label and liked object) up front.
+
+    - Joins the author and content type of every like.
+    - Prefetches the liked objects per content type (one query per type)
+        instead of resolving the GenericForeignKey row by row.
+    - Liked comments also join their author for Comment.__str__, which
+        only needs the post item id (no join).
+    - Shared by LikeUserInline and LikeAdmin.
+    """
+    return queryset.select_related("author", "content_type").prefetch_related(
+        GenericPrefetch(
+            "liked_object",
+            [
+                PostItem.objects.all(),
+                Comment.objects.select_related("author"),
+            ],
+        )
+    )
+
+
 class CommentInline(admin.TabularInline):
     """
     Inline admin for comments.
@@ -24,6 +47,13 @@ class CommentInline(admin.TabularInline):
     # Prevent editing creation timestamps
     readonly_fields = ("dt_created",) 
 
+    def get_queryset(self, request):
+        """
+        Join the comment author, which Comment.__str__ reads for the label
+        rendered on each inline row.
+        """
+        return super().get_queryset(request).select_related("author")
+
 
 class LikeUserInline(admin.TabularInline):
     """
@@ -41,6 +71,13 @@ class LikeUserInline(admin.TabularInline):
     verbose_name = "Given Like"
     verbose_name_plural = "Given Likes"
 
+    def get_queryset(self, request):
+        """
+        Load the relations shown for each inline row up front
+        (see with_liked_objects()).
+        """
+        return with_liked_objects(super().get_queryset(request))
+
 
 class LikePostInline(GenericTabularInline):
     """
@@ -57,6 +94,50 @@ class LikePostInline(GenericTabularInline):
     verbose_name = "Received Like"
     verbose_name_plural = "Received Likes"
 
+    def get_queryset(self, request):
+        """
+        Join the author and content type of every received like,
+        instead of loading them one row at a time.
+        """
+        return super().get_queryset(request).select_related("author", "content_type")
+
+
+class PriceBucketFilter(admin.SimpleListFilter):
+    """
+    Sidebar filter that groups item prices into a few fixed ranges.
+
+    - Replaces filtering on the raw 'item_price' column, which makes the admin
+        load every distinct price to build the filter choices.
+    - Each bucket maps to a simple range lookup (lower bound inclusive).
+    """
+    title = "price"
+    parameter_name = "price"
+
+    # (parameter value, label, lower bound, upper bound)
+    BUCKETS = (
+        ("lt10", "Under 10 €", None, 10),
+        ("10-50", "10 € – 49 €", 10, 50),
+        ("50-100", "50 € – 99 €", 50, 100),
+        ("gte100", "100 € and over", 100, None),
+    )
+
+    def lookups(self, request, model_admin):
+        return [(value, label) for value, label, _, _ in self.BUCKETS]
+
+    def queryset(self, request, queryset):
+        for value, _, low, high in self.BUCKETS:
+            if self.value() == value:
+                if low is not None:
+                    queryset = queryset.filter(item_price__gte=low)
+                if high is not None:
+                    queryset = queryset.filter(item_price__lt=high)
+                return queryset
+        return queryset
+
+
+# Custom profile fields of the User model, shared by the change and add forms
+CUSTOM_USER_FIELDS = ("nickname", "address", "city", "profile_pic", "intro", "seller_rating")
+
 
 # Register the custom User model in the admin site
 # and use a custom admin class that extends Django's built-in UserAdmin
@@ -72,45 +153,43 @@ class CustomUserAdmin(BaseUserAdmin):
     # Extend the default fieldsets to show custom fields
     # in the change form (edit existing user in the admin)
     fieldsets = BaseUserAdmin.fieldsets + (
-        ("Custom Fields", {"fields": ("nickname", "address", "city", "profile_pic", "intro", "seller_rating")}),
+        ("Custom Fields", {"fields": CUSTOM_USER_FIELDS}),
     )
 
     # Extend the add_fieldsets to include custom fields
     # in the add form (create a new user in the admin)
     add_fieldsets = BaseUserAdmin.add_fieldsets + (
-        (
-            "Custom Fields",
-            {
-                "classes": ("wide",),
-                "fields": (
-                    "nickname",
-                    "address",
-                    "city",
-                    "profile_pic",
-                    "intro",
-                    "seller_rating",
-                ),
-            },
-        ),
+        ("Custom Fields", {"classes": ("wide",), "fields": CUSTOM_USER_FIELDS}),
     )
 
     # Columns shown in the user list view in the admin.
+    # 'has_profile_pic' replaces the raw ImageField column (see below).
     list_display = (
         "nickname",
         "username",
         "email",
         "seller_rating",
-        "profile_pic",
+        "has_profile_pic",
         "address",
         "city",
         "is_staff",
     )
 
+    # Extend the default user search (username, first/last name, email) with
+    # the nickname; also used by PostItemAdmin's author autocomplete
+    search_fields = BaseUserAdmin.search_fields + ("nickname",)
+
     # Inlines to show related data
     # CommentInline: Shows comments authored by this user (based on Comment.author)
     # LikeUserInline: Shows likes clicked by this user (based on Like.author)
     inlines = (CommentInline, LikeUserInline )
 
+    # Boolean icon instead of rendering the image file per row.
+    # Only reads the stored file name, so no storage (.url) call is made.
+    @admin.display(description="Profile Pic", boolean=True)
+    def has_profile_pic(self, obj):
+        return bool(obj.profile_pic.name)
+
 
 # Register the PostItem model with a basic ModelAdmin configuration
 @admin.register(PostItem)
@@ -132,20 +211,39 @@ class PostItemAdmin(admin.ModelAdmin):
     )
 
     # Filters in the right sidebar
-    list_filter = ("is_sold", "item_price","item_condition", "dt_created", "dt_updated")
+    # Prices are grouped into ranges by PriceBucketFilter
+    # The author filter only lists users who have posted items
+    list_filter = (
+        "is_sold",
+        PriceBucketFilter,
+        "item_condition",
+        ("item_author", admin.RelatedOnlyFieldListFilter),
+        "dt_created",
+        "dt_updated",
+    )
 
     # Fields that can be searched via the search box
+    # Only local columns: searching through item_author would JOIN the user table
+    # on every search. Use the author filter in the sidebar instead.
+    # item_condition is an integer choice and is filtered via list_filter instead.
     search_fields = (
         "item_title",
-        "item_price",
-        "item_condition",
-        "item_author__nickname",
-        "item_author__username"
     )
 
+    # Pick the author via an AJAX search (CustomUserAdmin.search_fields)
+    # instead of rendering every user into a <select>
+    autocomplete_fields = ("item_author",)
+
     # Default ordering in the list view (newest first)
     ordering = ("-dt_created",)
 
+    # Join the author in the changelist query instead of one SELECT per row
+    list_select_related = ("item_author",)
+
+    # Skip the extra unfiltered COUNT(*) the changelist runs to show
+    # "N results (M total)" when a filter or search is active
+    show_full_result_count = False
+
     # Inlines to show interaction data
     # CommentInline: Shows comments attached to this post (based on Comment.post_item)
     # LikePostInline: Shows likes received by this post (via GenericForeignKey)
@@ -163,6 +261,10 @@ class CommentAdmin(admin.ModelAdmin):
     # 'comment_info' is a custom method defined below.
     list_display = ("comment_info", "dt_created", "dt_updated")
 
+    # Comment.__str__ reads the author (and only the raw post_item_id),
+    # so join the author in the changelist query to avoid one SELECT per row
+    list_select_related = ("author",)
+
     # Custom method to display the model's __str__ representation in the list view.
     # The 'description' argument sets the column header name in the admin UI.
     @admin.display(description="Comment Info")
@@ -181,6 +283,13 @@ class LikeAdmin(admin.ModelAdmin):
     # Columns shown in the list view
     list_display = ("like_info", "dt_created")
 
+    def get_queryset(self, request):
+        """
+        Load the relations used by Like.__str__ up front
+        (see with_liked_objects()).
+        """
+        return with_liked_objects(super().get_queryset(request))
+
     # Custom method to display a summary of the like instance
     @admin.display(description="Like Info")
     def like_info(self, obj):
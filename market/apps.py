@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class MarketConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'market'
+
+    def ready(self):
+        # Register the signal handlers that keep the like/comment counters in sync
+        from market import signals  # noqa: F401
@@ -0,0 +1,29 @@
+from market.models import PostItem, Comment
+
+
+# URL names of the models that can be liked (each has a 'likes_count' column)
+LIKE_TARGETS = {
+    "item": PostItem,
+    "comment": Comment,
+}
+
+
+class LikeTargetConverter:
+    """
+    Path converter for the like URL's target segment ("item" or "comment").
+
+    - The regex only matches known targets, so any other value is rejected
+        by the URL resolver (404) before the view or its mixins run.
+    - to_python() hands the view the model class instead of the name.
+    """
+
+    regex = "|".join(LIKE_TARGETS)
+
+    def to_python(self, value):
+        return LIKE_TARGETS[value]
+
+    def to_url(self, value):
+        # Accept both the target name (as used in templates) and the model class
+        if isinstance(value, str):
+            return value
+        return next(name for name, model in LIKE_TARGETS.items() if model is value)
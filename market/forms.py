@@ -4,7 +4,31 @@ from allauth.account.forms import SignupForm, LoginForm, ResetPasswordForm, Rese
 from .models import User, PostItem, Comment
 
 
-class CustomSignupForm(SignupForm):
+class RequiredMessagesMixin:
+    """
+    Shared behaviour for all market forms.
+
+    - Never renders the HTML5 'required' attribute on any widget,
+        so validation is handled by Django only.
+    - Applies the custom "required" error messages declared in
+        'required_messages' ({field_name: message}); fields the form
+        does not have are skipped.
+    """
+
+    use_required_attribute = False
+
+    required_messages = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        fields = self.fields
+        for name, msg in self.required_messages.items():
+            if name in fields:
+                fields[name].error_messages["required"] = msg
+
+
+class CustomSignupForm(RequiredMessagesMixin, SignupForm):
     """
     Custom signup form extending django-allauth's SignupForm.
 
@@ -22,32 +46,25 @@ class CustomSignupForm(SignupForm):
     # Required city field displayed on the signup page
     # city = forms.CharField(max_length=40, required=True, label="City")
 
+    # Custom "required" error messages for signup fields
+    required_messages = {
+        "email": "Please enter your e-mail address.",
+        # "nickname": "Please enter your nickname.",
+        # "address": "Please enter your address.",
+        # "city": "Please enter your city.",
+        "password1": "Please choose a password.",
+        "password2": "Please confirm your password.",
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # remove HTML5 `required` attribute from all widgets
-        for field in self.fields.values():
-            field.widget.attrs.pop("required", None)
-
         # Remove all help text from password fields
         if "password1" in self.fields:
             self.fields["password1"].help_text = ""
         if "password2" in self.fields:
             self.fields["password2"].help_text = ""
 
-        # Custom "required" error messages for signup fields
-        field_msgs = {
-            "email": "Please enter your e-mail address.",
-            # "nickname": "Please enter your nickname.",
-            # "address": "Please enter your address.",
-            # "city": "Please enter your city.",
-            "password1": "Please choose a password.",
-            "password2": "Please confirm your password.",
-        }
-        for name, msg in field_msgs.items():
-            if name in self.fields:
-                self.fields[name].error_messages["required"] = msg
-
     # def clean_nickname(self):
     #     """
     #     Validate that the nickname is unique before saving the user.
@@ -87,14 +104,15 @@ class CustomSignupForm(SignupForm):
     #     return user
 
 
-class ProfileForm(forms.ModelForm):
+class ProfileForm(RequiredMessagesMixin, forms.ModelForm):
     """
     Form used for editing the user's profile after signup.
 
     - Lets the user set profile_pic, nickname, address, city, and intro.
     - Removes HTML5 `required` attributes from widgets (server-side validation only).
     - Provides custom "required" error messages for key profile fields.
-    - Ensures nickname is unique, excluding the current user.
+    - Nickname uniqueness is left to the DB unique index
+        (the view turns an IntegrityError into a form error).
     """
     class Meta:
         model = User
@@ -111,29 +129,19 @@ class ProfileForm(forms.ModelForm):
             "intro": forms.Textarea,
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        # Remove HTML5 `required` attribute from all widgets
-        for field in self.fields.values():
-            field.widget.attrs.pop("required", None)
-
-        # Custom "required" error messages for profile fields
-        field_msgs = {
-            "nickname": "Please enter your nickname.",
-            "address": "Please enter your address.",
-            "city": "Please enter your city and state.",
-        }
-        for name, msg in field_msgs.items():
-            if name in self.fields:
-                self.fields[name].error_messages["required"] = msg
+    # Custom "required" error messages for profile fields
+    required_messages = {
+        "nickname": "Please enter your nickname.",
+        "address": "Please enter your address.",
+        "city": "Please enter your city and state.",
+    }
 
     def clean_nickname(self):
         """
-        Validate that the nickname is not empty and is unique.
+        Validate that the nickname is not empty.
 
-        Excludes the current user instance when checking for duplicates,
-        so users can keep their existing nickname.
+        Uniqueness is not checked here: the unique index on 'nickname'
+        rejects duplicates at save time, which saves a SELECT per submit.
         """
         # Value submitted for the nickname field
         nickname = self.cleaned_data.get("nickname")
@@ -142,90 +150,61 @@ class ProfileForm(forms.ModelForm):
         if not nickname:
             raise forms.ValidationError("Please enter your nickname.")
 
-        # Base queryset of users with the same nickname
-        qs = User.objects.filter(nickname=nickname)
-
-        # Exclude the current user when editing an existing profile
-        if self.instance.pk:
-            qs = qs.exclude(pk=self.instance.pk)
-
-        # If any other user already has this nickname, raise an error
-        if qs.exists():
-            raise forms.ValidationError("This nickname is already taken.")
-
         # Return the validated nickname
         return nickname
 
+    def validate_unique(self):
+        """
+        Run the model's unique checks, except for 'nickname'.
 
-class CustomLoginForm(LoginForm):
-    """Login form with HTML5 `required` removed and custom error messages."""
+        - A duplicate nickname surfaces as an IntegrityError on save
+            and is reported by NicknameConflictMixin in the views.
+        """
+        exclude = self._get_validation_exclusions()
+        exclude.add("nickname")
+        try:
+            self.instance.validate_unique(exclude=exclude)
+        except forms.ValidationError as e:
+            self._update_errors(e)
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
 
-        # remove HTML `required` attributes
-        for field in self.fields.values():
-            field.widget.attrs.pop("required", None)
+class CustomLoginForm(RequiredMessagesMixin, LoginForm):
+    """Login form with HTML5 `required` removed and custom error messages."""
 
-        # custom required messages
-        self.fields["login"].error_messages[
-            "required"
-        ] = "Please enter your e-mail address."
-        self.fields["password"].error_messages[
-            "required"
-        ] = "Please enter your password."
+    # custom required messages
+    required_messages = {
+        "login": "Please enter your e-mail address.",
+        "password": "Please enter your password.",
+    }
 
-class CustomResetPasswordForm(ResetPasswordForm):
+class CustomResetPasswordForm(RequiredMessagesMixin, ResetPasswordForm):
     """Password reset form with custom required message and no HTML5 validation."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        for field in self.fields.values():
-            field.widget.attrs.pop("required", None)
-
-        self.fields["email"].error_messages[
-            "required"
-        ] = "Please enter the e-mail address of your account."
+    required_messages = {
+        "email": "Please enter the e-mail address of your account.",
+    }
 
 
-class CustomResetPasswordFromKeyForm(ResetPasswordKeyForm):
+class CustomResetPasswordFromKeyForm(RequiredMessagesMixin, ResetPasswordKeyForm):
     """Form used after clicking the reset link; sets a new password."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        for field in self.fields.values():
-            field.widget.attrs.pop("required", None)
-
-        self.fields["password1"].error_messages[
-            "required"
-        ] = "Please enter a new password."
-        self.fields["password2"].error_messages[
-            "required"
-        ] = "Please confirm your new password."
+    required_messages = {
+        "password1": "Please enter a new password.",
+        "password2": "Please confirm your new password.",
+    }
 
 
-class CustomChangePasswordForm(ChangePasswordForm):
+class CustomChangePasswordForm(RequiredMessagesMixin, ChangePasswordForm):
     """Change password form shown to logged-in users."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    required_messages = {
+        "oldpassword": "Please enter your current password.",
+        "password1": "Please enter a new password.",
+        "password2": "Please confirm your new password.",
+    }
 
-        for field in self.fields.values():
-            field.widget.attrs.pop("required", None)
-
-        msgs = {
-            "oldpassword": "Please enter your current password.",
-            "password1": "Please enter a new password.",
-            "password2": "Please confirm your new password.",
-        }
-        for name, msg in msgs.items():
-            if name in self.fields:
-                self.fields[name].error_messages["required"] = msg
 
-
-class BasePostItemForm(forms.ModelForm):
+class BasePostItemForm(RequiredMessagesMixin, forms.ModelForm):
     """
     Base ModelForm for PostItem used by both create and update forms.
 
@@ -247,43 +226,36 @@ class BasePostItemForm(forms.ModelForm):
             "item_image3": forms.FileInput(attrs={"class": "hidden"}),
         }
 
-    def __init__(self, *args, **kwargs):
-        """
-        Customize the default form behavior after initialization.
-
-        -   Remove HTML 'required' attributes from all fields to prevent
-            browser-side validation popups and rely solely on Django's
-            server-side validation.
-        -   For selected fields, copy the model's 'blank' error message
-            to the form field's 'required' error, so that when the form
-            reports a required-field error, it uses the same text defined
-            on the model.
-        """
-        super().__init__(*args, **kwargs)
-
-        # Remove HTML5 required attributes from all widgets
-        for _, field in self.fields.items():
-            field.widget.attrs.pop("required", None)
-
-        # For these fields, reuse the model-level "blank" error message
-        # as the form-level "required" error message.
-        # This avoids hard-coding the same text in both model and form.
+    # For these fields, reuse the model-level "blank" error message
+    # as the form-level "required" error message.
+    # This avoids hard-coding the same text in both model and form.
+    # The messages are static, so they are read from the model once at import.
+    required_messages = {
+        name: PostItem._meta.get_field(name).error_messages["blank"]
         for name in [
             "item_title",
             "item_price",
             "item_condition",
             "item_detail",
             "item_image1",
-        ]:
-            # Get the corresponding model field definition
-            model_field = self._meta.model._meta.get_field(name)
+        ]
+        if PostItem._meta.get_field(name).error_messages.get("blank")
+    }
 
-            # Read the 'blank' error message from the model field
-            blank_msg = model_field.error_messages.get("blank")
+    def validate_constraints(self):
+        """
+        Run the model's constraint checks, except those on 'item_price'.
 
-            # If a blank message exists, apply it to the form field's 'required' error
-            if blank_msg:
-                self.fields[name].error_messages["required"] = blank_msg
+        - 'item_price >= 1' is already validated by the field's
+            MinValueValidator; re-checking the DB constraint here would
+            cost an extra SELECT per submit.
+        """
+        exclude = self._get_validation_exclusions()
+        exclude.add("item_price")
+        try:
+            self.instance.validate_constraints(exclude=exclude)
+        except forms.ValidationError as e:
+            self._update_errors(e)
 
 
 class PostItemCreateForm(BasePostItemForm):
@@ -328,7 +300,7 @@ class PostItemUpdateForm(BasePostItemForm):
         ]
 
 
-class CommentForm(forms.ModelForm):
+class CommentForm(RequiredMessagesMixin, forms.ModelForm):
     """
     Form used for creating new comments on a post item.
 
@@ -340,15 +312,3 @@ class CommentForm(forms.ModelForm):
         model = Comment
         fields = ["content",]
         widgets = {"content": forms.Textarea,}
-
-    def __init__(self, *args, **kwargs):
-        """
-        Customize the default form behavior after initialization.
-
-        - Remove the HTML5 'required' attribute from the content field
-            to prevent browser-side validation popups.
-        """
-        super().__init__(*args, **kwargs)
-
-        # Remove HTML5 required attribute to match the project's validation style
-        self.fields["content"].widget.attrs.pop("required", None)
@@ -1,5 +1,10 @@
 from django.shortcuts import redirect
-from django.urls import reverse
+from django.urls import get_script_prefix, reverse
+
+
+# Session flag set once the logged-in user's profile is known to be complete.
+# Lets ProfileRequiredMiddleware skip loading request.user on later requests.
+PROFILE_COMPLETE_SESSION_KEY = "_profile_complete"
 
 
 class ProfileRequiredMiddleware:
@@ -13,43 +18,56 @@ class ProfileRequiredMiddleware:
         excluded from the redirect.
     """
 
+    # Path prefixes that are never redirected (static and uploaded media files)
+    exempt_prefixes = ("/static/", "/media/")
+
     def __init__(self, get_response):
         # One-time configuration and initialization.
         # Django passes the next callable in the middleware chain.
         self.get_response = get_response
 
+        # Paths that are allowed even when the profile is incomplete.
+        # Resolved once here instead of on every request, with any script
+        # prefix stripped: they are compared with request.path_info, which
+        # never includes SCRIPT_NAME.
+        prefix_length = len(get_script_prefix()) - 1
+        self.exempt_paths = frozenset(
+            reverse(name)[prefix_length:]
+            for name in ("profile-set", "account_logout", "account_login", "account_signup")
+        )
+
     def __call__(self, request):
         """
         Called on every request.
 
-        - Checks the current user and path.
+        - Static/media requests are passed through before the user is loaded.
+        - Sessions already flagged as having a complete profile skip the check.
         - If the user is authenticated but profile is incomplete and the
             request path is not in the exempt list, redirect to 'profile-set'.
         """
+        # Path without SCRIPT_NAME, matching the prefix-less paths resolved above
+        path = request.path_info
+
+        # Static/media files never need the profile check
+        if path.startswith(self.exempt_prefixes):
+            return self.get_response(request)
+
+        # Profile already known to be complete for this session:
+        # no need to load the user at all
+        if request.session.get(PROFILE_COMPLETE_SESSION_KEY):
+            return self.get_response(request)
+
         user = request.user
 
         if user.is_authenticated:
-            # Profile is considered incomplete if any of these fields are missing
-            incomplete = not user.nickname or not user.address or not user.city
-
-            if incomplete:
-                path = request.path
-
-                # Paths that are allowed even when the profile is incomplete
-                exempt_paths = {
-                    reverse("profile-set"),
-                    reverse("account_logout"),
-                    reverse("account_login"),
-                    reverse("account_signup"),
-                }
-
-                # Redirect if the current path is not exempt and is not a static/media file
-                if (
-                    path not in exempt_paths
-                    and not path.startswith("/static/")
-                    and not path.startswith("/media/")
-                ):
-                    return redirect("profile-set")
+            # Profile is considered incomplete if any of nickname, address or city
+            # is missing (cached on the user row as 'profile_complete')
+            if user.profile_complete:
+                # Remember it so the following requests take the fast path above
+                request.session[PROFILE_COMPLETE_SESSION_KEY] = True
+            elif path not in self.exempt_paths:
+                # Reversed per redirect so the URL includes the script prefix
+                return redirect("profile-set")
 
         # If profile is complete or user is anonymous, continue the normal flow
         return self.get_response(request)
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:01
+
+from django.db import migrations, models
+
+
+def backfill_profile_complete(apps, schema_editor):
+    """Mark existing users whose nickname, address and city are all filled in."""
+    User = apps.get_model("market", "User")
+    (
+        User.objects.exclude(nickname__isnull=True)
+        .exclude(nickname="")
+        .exclude(address__isnull=True)
+        .exclude(address="")
+        .exclude(city__isnull=True)
+        .exclude(city="")
+        .update(profile_complete=True)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0017_alter_comment_options_alter_postitem_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='profile_complete',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(backfill_profile_complete, migrations.RunPython.noop),
+    ]
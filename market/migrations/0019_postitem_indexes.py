@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0018_user_profile_complete'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='postitem',
+            index=models.Index(fields=['-dt_created', '-id'], name='postitem_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postitem',
+            index=models.Index(fields=['is_sold', '-dt_created', '-id'], name='postitem_sold_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postitem',
+            index=models.Index(fields=['item_condition'], name='postitem_condition_idx'),
+        ),
+    ]
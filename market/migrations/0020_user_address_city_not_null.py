@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:07
+
+from django.db import migrations, models
+
+
+def null_to_empty(apps, schema_editor):
+    """Replace NULL address/city values with "" before the columns become NOT NULL."""
+    User = apps.get_model("market", "User")
+    User.objects.filter(address__isnull=True).update(address="")
+    User.objects.filter(city__isnull=True).update(city="")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0019_postitem_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(null_to_empty, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='user',
+            name='address',
+            field=models.CharField(default='', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='city',
+            field=models.CharField(default='', max_length=40),
+        ),
+    ]
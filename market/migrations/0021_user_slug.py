@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:10
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def backfill_slug(apps, schema_editor):
+    """Fill 'slug' for existing users from their nickname or username."""
+    User = apps.get_model("market", "User")
+    users = list(User.objects.only("id", "nickname", "username"))
+    for user in users:
+        user.slug = slugify(user.nickname or user.username or "user")[:150]
+    User.objects.bulk_update(users, ["slug"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0020_user_address_city_not_null'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='slug',
+            field=models.SlugField(blank=True, db_index=False, default='', editable=False, max_length=150),
+        ),
+        migrations.RunPython(backfill_slug, migrations.RunPython.noop),
+    ]
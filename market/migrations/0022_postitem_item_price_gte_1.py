@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0021_user_slug'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='postitem',
+            constraint=models.CheckConstraint(condition=models.Q(('item_price__gte', 1)), name='item_price_gte_1'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('market', '0022_postitem_item_price_gte_1'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='like',
+            index=models.Index(fields=['content_type', 'object_id'], name='like_target_idx'),
+        ),
+    ]
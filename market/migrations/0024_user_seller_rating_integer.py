@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:14
+
+from django.db import migrations, models
+
+
+def clean_seller_rating(apps, schema_editor):
+    """Reset ratings that are not "1".."5" to "1" so the column can be cast to an integer."""
+    User = apps.get_model("market", "User")
+    User.objects.exclude(seller_rating__in=["1", "2", "3", "4", "5"]).update(seller_rating="1")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0023_like_target_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(clean_seller_rating, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='user',
+            name='seller_rating',
+            field=models.PositiveSmallIntegerField(choices=[(1, '1'), (2, '2'), (3, '3'), (4, '4'), (5, '5')], default=1),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:15
+
+from django.db import migrations, models
+
+
+# Old string values -> new integer values (stored as digit strings until
+# the AlterField below converts the column)
+CONDITION_MAP = {"new": "0", "excellent": "1", "good": "2", "fair": "3", "poor": "4"}
+
+
+def conditions_to_numbers(apps, schema_editor):
+    """Rewrite the condition strings as the digits of the new integer choices."""
+    PostItem = apps.get_model("market", "PostItem")
+    for old, new in CONDITION_MAP.items():
+        PostItem.objects.filter(item_condition=old).update(item_condition=new)
+    # Unknown values fall back to GOOD so the column can be cast to an integer
+    PostItem.objects.exclude(item_condition__in=CONDITION_MAP.values()).update(item_condition="2")
+
+
+def numbers_to_conditions(apps, schema_editor):
+    """Reverse of conditions_to_numbers (runs after the column is text again)."""
+    PostItem = apps.get_model("market", "PostItem")
+    for old, new in CONDITION_MAP.items():
+        PostItem.objects.filter(item_condition=new).update(item_condition=old)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0024_user_seller_rating_integer'),
+    ]
+
+    operations = [
+        migrations.RunPython(conditions_to_numbers, numbers_to_conditions),
+        migrations.AlterField(
+            model_name='postitem',
+            name='item_condition',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'NEW'), (1, 'EXCELLENT'), (2, 'GOOD'), (3, 'FAIR'), (4, 'POOR')], default=None, error_messages={'blank': 'Please select a condition for your item.', 'invalid_choice': 'Invalid condition selected.'}),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:16
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count_subquery(queryset, field):
+    """COUNT(*) of 'queryset' grouped by 'field', correlated to the outer row's pk."""
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(total=Count("*"))
+            .values("total")
+        ),
+        0,
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    """Fill likes_count/comments_count from the existing Like and Comment rows."""
+    PostItem = apps.get_model("market", "PostItem")
+    Comment = apps.get_model("market", "Comment")
+    Like = apps.get_model("market", "Like")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+
+    PostItem.objects.update(comments_count=_count_subquery(Comment.objects.all(), "post_item_id"))
+
+    # Content types only exist once the app has been migrated before;
+    # on a fresh database there are no likes to count
+    for model, name in ((PostItem, "postitem"), (Comment, "comment")):
+        ctype = ContentType.objects.filter(app_label="market", model=name).first()
+        if ctype is not None:
+            likes = Like.objects.filter(content_type_id=ctype.pk)
+            model.objects.update(likes_count=_count_subquery(likes, "object_id"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('market', '0025_postitem_item_condition_integer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='postitem',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='postitem',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
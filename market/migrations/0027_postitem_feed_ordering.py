@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:23
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0026_like_comment_counters'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='postitem',
+            options={'ordering': ['-dt_created', '-id']},
+        ),
+    ]
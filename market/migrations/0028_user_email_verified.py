@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:29
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+
+
+def backfill_email_verified(apps, schema_editor):
+    """Set email_verified for users that already have a verified EmailAddress."""
+    User = apps.get_model("market", "User")
+    EmailAddress = apps.get_model("account", "EmailAddress")
+
+    User.objects.update(
+        email_verified=Exists(EmailAddress.objects.filter(user_id=OuterRef("pk"), verified=True))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0001_initial'),
+        ('market', '0027_postitem_feed_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='email_verified',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(backfill_email_verified, migrations.RunPython.noop),
+    ]
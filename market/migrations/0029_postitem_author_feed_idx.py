@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0028_user_email_verified'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='postitem',
+            index=models.Index(fields=['item_author', '-dt_created', '-id'], name='postitem_author_feed_idx'),
+        ),
+    ]
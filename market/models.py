@@ -1,4 +1,7 @@
+import re
+
 from django.db import models
+from django.utils.text import slugify
 
 # Reusable base class for a fully featured User model
 from django.contrib.auth.models import AbstractUser
@@ -15,6 +18,23 @@ from market.utils import item_image_upload_to, profile_image_upload_to
 from django.core.validators import MinValueValidator, FileExtensionValidator
 
 
+# ASCII values of this shape are returned unchanged (lowercased) by slugify()
+SAFE_SLUG_RE = re.compile(r"[a-z0-9]+(?:[-_][a-z0-9]+)*")
+
+
+def _user_slug(value):
+    """
+    Return slugify(value) truncated to the User.slug length.
+
+    - Most nicknames/usernames are already plain ASCII words, so those skip
+        slugify()'s unicode normalization and regex substitutions.
+    """
+    lowered = value.lower()
+    if value.isascii() and SAFE_SLUG_RE.fullmatch(lowered):
+        return lowered[:150]
+    return slugify(value)[:150]
+
+
 # Custom user model extending Django's default AbstractUser
 class User(AbstractUser):
     """
@@ -25,6 +45,9 @@ class User(AbstractUser):
     - address, city: basic location information
     - profile_pic: user avatar image with a sensible default
     - intro: short user bio shown on the profile page
+    - profile_complete: cached flag telling whether nickname, address
+        and city are all filled in
+    - slug: cached slug of nickname/username, used for upload folders
     """
 
     # Optional unique nickname field for each user
@@ -35,11 +58,11 @@ class User(AbstractUser):
         validators=[validate_no_special_characters]    
     )
 
-    # Optional address field for each user
-    address = models.CharField(max_length=50, null=True)
+    # Optional address field for each user ("" until the profile is set)
+    address = models.CharField(max_length=50, default="")
 
-    # Optional city field for each user
-    city = models.CharField(max_length=40, null=True)
+    # Optional city field for each user ("" until the profile is set)
+    city = models.CharField(max_length=40, default="")
 
     # Profile picture shown on the user's profile and listings
     # Uses a default image and uploads to a per-user folder via profile_image_upload_to()
@@ -50,19 +73,163 @@ class User(AbstractUser):
 
     # Available 1–5 rating choices for the seller rating
     RATING_CHOICES = [
-        ("1", "1"),
-        ("2", "2"),
-        ("3", "3"),
-        ("4", "4"),
-        ("5", "5"),
+        (1, "1"),
+        (2, "2"),
+        (3, "3"),
+        (4, "4"),
+        (5, "5"),
     ]
     # Seller rating score (1–5) used to display seller reputation (e.g. stars)
-    # Defaults to 1 for newly created users
-    seller_rating = models.CharField(max_length=5, choices=RATING_CHOICES, default=1)
+    # Stored as a small integer; defaults to 1 for newly created users
+    seller_rating = models.PositiveSmallIntegerField(choices=RATING_CHOICES, default=1)
+
+    # Denormalized flag: True once nickname, address and city are all set.
+    # Kept in sync by save() so redirect/middleware checks read a single column.
+    profile_complete = models.BooleanField(default=False)
+
+    # Denormalized flag: True while the user has at least one verified EmailAddress.
+    # Kept in sync by market.signals so permission checks don't query allauth's table.
+    email_verified = models.BooleanField(default=False, editable=False)
+
+    # Cached slugify(nickname or username), used as the per-user media folder.
+    # Kept in sync by save() so upload paths don't re-run slugify per file.
+    slug = models.SlugField(max_length=150, blank=True, default="", db_index=False, editable=False)
 
     def __str__(self):
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the value the stored slug was built from.
+
+        - Lets save() skip slugify() when nickname/username did not change.
+        - Skipped if either field was deferred (only()/defer()).
+        """
+        instance = super().from_db(db, field_names, values)
+
+        loaded = instance.__dict__
+        if "nickname" in loaded and "username" in loaded:
+            instance._slug_source = loaded["nickname"] or loaded["username"] or "user"
+
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Recompute 'profile_complete' and 'slug' from the profile fields before saving.
+
+        - The slug is only re-slugified when its source value changed
+            since the user was loaded (or on first save).
+        - If only some columns are written (update_fields) and any of the
+            source fields is among them, the derived columns are written as well.
+        """
+        self.profile_complete = bool(self.nickname and self.address and self.city)
+
+        slug_source = self.nickname or self.username or "user"
+        if slug_source != getattr(self, "_slug_source", None):
+            self.slug = _user_slug(slug_source)
+            self._slug_source = slug_source
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if {"nickname", "address", "city"} & update_fields:
+                update_fields.add("profile_complete")
+            if {"nickname", "username"} & update_fields:
+                update_fields.add("slug")
+            kwargs["update_fields"] = update_fields
+
+        super().save(*args, **kwargs)
+
+
+# Available condition choices for a PostItem
+# Stored as small integers in the database and rendered as a select/radio in forms.
+class ItemCondition(models.IntegerChoices):
+    NEW = 0, "NEW"
+    EXCELLENT = 1, "EXCELLENT"
+    GOOD = 2, "GOOD"
+    FAIR = 3, "FAIR"
+    POOR = 4, "POOR"
+
+
+# QuerySet helpers for PostItem
+class PostItemQuerySet(models.QuerySet):
+    """
+    Custom QuerySet for PostItem.
+
+    - listing(): narrow projection for item cards (index, profile, user item list).
+    - detail(): the full item row plus only the seller columns the detail page shows.
+    """
+
+    # Columns an item card renders (title, price, thumbnail, sold badge, date,
+    # seller city). Large columns such as 'item_detail' are left out.
+    LISTING_FIELDS = (
+        "id",
+        "item_title",
+        "item_price",
+        "item_image1",
+        "is_sold",
+        "dt_created",
+        "item_author",
+        "item_author__city",
+    )
+
+    def listing(self):
+        """
+        Restrict the query to the columns item cards need.
+
+        - Joins the author but only loads its 'city'.
+        - Edit views should keep using the full row.
+        """
+        return self.select_related("item_author").only(*self.LISTING_FIELDS)
+
+    # Columns the item detail page renders: every item column except
+    # 'dt_updated', and from the seller only what the seller card shows
+    # (password hash, email, intro, ... are left out)
+    DETAIL_FIELDS = (
+        "id",
+        "item_title",
+        "item_price",
+        "item_condition",
+        "item_detail",
+        "is_sold",
+        "item_image1",
+        "item_image2",
+        "item_image3",
+        "dt_created",
+        "likes_count",
+        "comments_count",
+        "item_author",
+        "item_author__nickname",
+        "item_author__city",
+        "item_author__profile_pic",
+        "item_author__seller_rating",
+    )
+
+    def detail(self):
+        """
+        Restrict the query to the columns the item detail page needs.
+
+        - Not meant for instances that get edited and saved (use the full row).
+        """
+        return self.select_related("item_author").only(*self.DETAIL_FIELDS)
+
+
+# Default manager for PostItem
+class PostItemManager(models.Manager.from_queryset(PostItemQuerySet)):
+    """
+    Default manager for PostItem.
+
+    - Always joins the author (select_related), since listings, the detail
+        page and the image upload path all read 'item_author'.
+    - Exposes the PostItemQuerySet helpers (e.g. PostItem.objects.listing()).
+    - Django's _base_manager stays a plain Manager, so relation traversal
+        and cascading deletes do not pay for the join.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("item_author")
+
 
 ## Post model for items listed in the market
 class PostItem(models.Model):
@@ -96,20 +263,9 @@ class PostItem(models.Model):
         },
     )
 
-    # Available condition choices for the item
-    # These values are stored in the database and rendered as a select/radio in forms.
-    CONDITION_CHOICES = [
-        ("new", "NEW"),
-        ("excellent", "EXCELLENT"),
-        ("good", "GOOD"),
-        ("fair", "FAIR"),
-        ("poor", "POOR"),
-    ]
-
-    # Condition of the item, restricted to the choices above.
-    item_condition = models.CharField(
-        max_length=10,
-        choices=CONDITION_CHOICES,
+    # Condition of the item, restricted to the ItemCondition choices.
+    item_condition = models.PositiveSmallIntegerField(
+        choices=ItemCondition.choices,
         default=None,
         error_messages={
             "blank": "Please select a condition for your item.",
@@ -196,6 +352,14 @@ class PostItem(models.Model):
     # - Enables cascading delete: if this post is deleted, associated likes are also deleted.
     likes = GenericRelation("Like", related_query_name="post_items")
 
+    # Denormalized counters, kept in sync by the signal handlers in market/signals.py.
+    # Templates read these instead of running COUNT(*) queries per render.
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Default manager: author is fetched in the same query
+    objects = PostItemManager()
+
     # Use the item title as the string representation in admin and shell.
     def __str__(self):
         return self.item_title
@@ -207,8 +371,26 @@ class PostItem(models.Model):
 
         - ordering: Default ordering for all queries is newest first (-dt_created).
             This removes the need to manually call .order_by() in views.
+            '-id' breaks ties between items created at the same instant, so
+            paginated pages never overlap or skip an item.
+        - indexes: Cover the default ordering, the "unsold items, newest first"
+            listing, a seller's items newest first (profile pages) and the
+            condition filter, so these queries can use an index scan instead
+            of sorting/scanning the whole table.
+        - constraints: The DB enforces item_price >= 1 for every write,
+            including ones that bypass forms (MinValueValidator still
+            provides the form error message).
         """
-        ordering = ["-dt_created"]
+        ordering = ["-dt_created", "-id"]
+        indexes = [
+            models.Index(fields=["-dt_created", "-id"], name="postitem_feed_idx"),
+            models.Index(fields=["is_sold", "-dt_created", "-id"], name="postitem_sold_feed_idx"),
+            models.Index(fields=["item_author", "-dt_created", "-id"], name="postitem_author_feed_idx"),
+            models.Index(fields=["item_condition"], name="postitem_condition_idx"),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(item_price__gte=1), name="item_price_gte_1"),
+        ]
 
 
 class Comment(models.Model):
@@ -242,10 +424,14 @@ class Comment(models.Model):
     # - Enables cascading delete: if this comment is deleted, associated likes are also deleted.
     likes = GenericRelation("Like", related_query_name="comments")
 
+    # Denormalized like counter, kept in sync by market/signals.py
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
+
     # String representation for debugging and admin display.
     # Formatted as: [Comment-Nickname]/[Item-ID]
+    # Uses the raw post_item_id column so the item row is not fetched.
     def __str__(self):
-        return f"[Comment-{self.author.nickname}]/[Item-{self.post_item.id}]"
+        return f"[Comment-{self.author.nickname}]/[Item-{self.post_item_id}]"
 
     # Default ordering configuration
     class Meta:
@@ -293,3 +479,10 @@ class Like(models.Model):
                 fields=["author", "content_type", "object_id"], name="unique_user_like"
             )
         ]
+
+        # Per-object lookups (likes.count, likes of one item/comment) filter on
+        # (content_type, object_id) without 'author', so the unique index above
+        # (which starts with author) can't serve them.
+        indexes = [
+            models.Index(fields=["content_type", "object_id"], name="like_target_idx"),
+        ]
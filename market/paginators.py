@@ -0,0 +1,68 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+
+# Cache key for the number of unsold items shown on the index page.
+# Deleted by the PostItem signals whenever an item is saved or deleted.
+UNSOLD_ITEMS_COUNT_CACHE_KEY = "market:unsold-items-count"
+
+
+class PkPaginator(Paginator):
+    """
+    Paginator that slices primary keys first and loads full rows only for the page.
+
+    - The OFFSET/LIMIT runs in a subquery that selects nothing but 'pk', so
+        deep pages skip over narrow index entries instead of full joined rows.
+    - The outer query then loads the page's rows (with the queryset's
+        select_related/only) by 'pk__in', keeping the queryset's ordering.
+    - Expects object_list to be an ordered QuerySet.
+    """
+
+    def page(self, number):
+        """
+        Return a Page object for the given 1-based page number.
+        """
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        # Primary keys of this page only, in the queryset's order
+        page_pks = self.object_list.values("pk")[bottom:top]
+
+        return self._get_page(self.object_list.filter(pk__in=page_pks), number, self)
+
+
+class CachedCountPaginator(PkPaginator):
+    """
+    PkPaginator that keeps the total row count in the cache.
+
+    - Pass 'count_cache_key' to cache the COUNT(*) under that key for
+        'count_cache_timeout' seconds; without it the count is not cached.
+    - Whoever passes a key is responsible for deleting it when the
+        underlying rows change (see market.signals).
+    """
+
+    # Upper bound for how long a count can be stale if an invalidation is missed
+    # (e.g. QuerySet.update(), which sends no signals)
+    count_cache_timeout = 60
+
+    def __init__(self, *args, count_cache_key=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+
+    @cached_property
+    def count(self):
+        """
+        Return the total number of objects, from the cache when possible.
+        """
+        if self.count_cache_key is None:
+            return super().count
+
+        return cache.get_or_set(
+            self.count_cache_key,
+            lambda: super(CachedCountPaginator, self).count,
+            self.count_cache_timeout,
+        )
@@ -0,0 +1,87 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from allauth.account.models import EmailAddress
+
+from market.models import PostItem, Comment, Like, User
+from market.paginators import UNSOLD_ITEMS_COUNT_CACHE_KEY
+from market.utils import bump_index_page_version
+
+
+# Models that carry a denormalized 'likes_count' column
+LIKEABLE_MODELS = (PostItem, Comment)
+
+
+def _increment(model, pk, field):
+    """Atomically add 1 to a counter column (single UPDATE, no read)."""
+    model._base_manager.filter(pk=pk).update(**{field: F(field) + 1})
+
+
+def _decrement(model, pk, field):
+    """Atomically subtract 1 from a counter column, never going below 0."""
+    model._base_manager.filter(pk=pk, **{f"{field}__gt": 0}).update(**{field: F(field) - 1})
+
+
+def _liked_model(like):
+    """
+    Return the model class a Like points to, if it keeps a like counter.
+
+    - Uses ContentType's per-process cache, so no query per like.
+    """
+    model = ContentType.objects.get_for_id(like.content_type_id).model_class()
+    return model if model in LIKEABLE_MODELS else None
+
+
+@receiver(post_save, sender=Like)
+def like_created(sender, instance, created, **kwargs):
+    """Increase the liked object's 'likes_count' when a new Like is saved."""
+    if not created:
+        return
+
+    model = _liked_model(instance)
+    if model is not None:
+        _increment(model, instance.object_id, "likes_count")
+
+
+@receiver(post_delete, sender=Like)
+def like_deleted(sender, instance, **kwargs):
+    """Decrease the liked object's 'likes_count' when a Like is deleted."""
+    model = _liked_model(instance)
+    if model is not None:
+        _decrement(model, instance.object_id, "likes_count")
+
+
+@receiver(post_save, sender=Comment)
+def comment_created(sender, instance, created, **kwargs):
+    """Increase the item's 'comments_count' when a new Comment is saved."""
+    if created:
+        _increment(PostItem, instance.post_item_id, "comments_count")
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, **kwargs):
+    """Decrease the item's 'comments_count' when a Comment is deleted."""
+    _decrement(PostItem, instance.post_item_id, "comments_count")
+
+
+@receiver(post_save, sender=PostItem)
+@receiver(post_delete, sender=PostItem)
+def postitem_changed(sender, **kwargs):
+    """Drop the cached index page count and pages when an item is added, edited or removed."""
+    cache.delete(UNSOLD_ITEMS_COUNT_CACHE_KEY)
+    bump_index_page_version()
+
+
+@receiver(post_save, sender=EmailAddress)
+@receiver(post_delete, sender=EmailAddress)
+def email_address_changed(sender, instance, **kwargs):
+    """
+    Recompute the owner's 'email_verified' flag when one of their addresses changes.
+
+    - Covers allauth's confirmation flow, address removal and admin edits alike.
+    """
+    User.objects.filter(pk=instance.user_id).update(
+        email_verified=EmailAddress.objects.filter(user_id=instance.user_id, verified=True).exists()
+    )
@@ -1,28 +1,47 @@
-from pathlib import Path
 from django import template
 
 register = template.Library()
 
+# Precomputed star ranges for the default 5-star scale, keyed by rating.
+# seller_rating is stored as an integer (1..5), so the common case maps directly
+# to a range and skips int() and clamping.
+DEFAULT_MAX_STARS = 5
+_FILLED_STARS = {}
+_EMPTY_STARS = {}
+for _rating in range(DEFAULT_MAX_STARS + 1):
+    _FILLED_STARS[_rating] = range(_rating)
+    _EMPTY_STARS[_rating] = range(DEFAULT_MAX_STARS - _rating)
+del _rating
 
-@register.filter
+
+@register.filter(is_safe=True)
 def filename_filter(value):
     """
     Return only the base filename from a FileField/ImageField value.
+
+    Storage names always use '/' as separator, so a plain string split
+    is enough (no pathlib.Path object per call).
     """
     if not value:
         return ""
 
-    path_str = getattr(value, "name", value)
+    # Templates pass either a FieldFile or its already-resolved name string
+    path_str = value if isinstance(value, str) else value.name
 
-    return Path(path_str).name
+    return path_str.rpartition("/")[2]
 
 
 @register.filter
-def filled_stars(rating, max_stars=5):
+def filled_stars(rating, max_stars=DEFAULT_MAX_STARS):
     """
     Return a range for the number of filled stars.
 
     """
+    if max_stars == DEFAULT_MAX_STARS:
+        stars = _FILLED_STARS.get(rating)
+        if stars is not None:
+            return stars
+
     try:
         rating = int(rating)
         max_stars = int(max_stars)
@@ -34,11 +53,16 @@ def filled_stars(rating, max_stars=5):
 
 
 @register.filter
-def empty_stars(rating, max_stars=5):
+def empty_stars(rating, max_stars=DEFAULT_MAX_STARS):
     """
     Return a range for the number of empty stars
     (max_stars - rating, never negative).
     """
+    if max_stars == DEFAULT_MAX_STARS:
+        stars = _EMPTY_STARS.get(rating)
+        if stars is not None:
+            return stars
+
     try:
         rating = int(rating)
         max_stars = int(max_stars)
@@ -49,7 +73,7 @@ def empty_stars(rating, max_stars=5):
     return range(max_stars - rating)
 
 
-@register.filter
+@register.filter(is_safe=True)
 def get_city(value):
     """
     Extracts the city part from a 'City, State' formatted string.
@@ -59,12 +83,11 @@ def get_city(value):
     if not value:
         return ""
 
-    parts = value.split(",", 1)
-    city = parts[0].strip()
-    return city
+    # partition() splits at the first comma without building a list
+    return value.partition(",")[0].strip()
 
 
-@register.filter
+@register.filter(is_safe=True)
 def get_state(value):
     """
     Extracts the state/region part from a 'City, State' formatted string.
@@ -74,40 +97,9 @@ def get_state(value):
     if not value:
         return ""
 
-    parts = value.split(",", 1)
-    if len(parts) < 2:
+    _, sep, state = value.partition(",")
+    if not sep:
         return ""
 
-    state = parts[1].strip()
-    return state
-
-
-@register.filter
-def user_liked(obj, user):
-    """
-    Custom filter to check if the given user has liked the specific object.
-
-    - Usage: {% if postitem|user_liked:user %}
-    - Returns False if the user is not authenticated.
-    - Uses the GenericRelation 'likes' to query for the user's like.
-    """
-
-    if not user.is_authenticated:
-        return False
-
-    return obj.likes.filter(author=user).exists()
-
-
-@register.filter
-def user_commented(obj, user):
-    """
-    Custom filter to check if the given user has commented on the specific object.
-
-    - Usage: {% if postitem|user_commented:user %}
-    - Returns False if the user is not authenticated.
-    - Uses the reverse ForeignKey 'comments' to query.
-    """
-    if not user.is_authenticated:
-        return False
+    return state.strip()
 
-    return obj.comments.filter(author=user).exists()
@@ -1,3 +1,403 @@
-from django.test import TestCase
+import io
+import os
+import shutil
+import tempfile
 
-# Create your tests here.
+from PIL import Image
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.paginator import EmptyPage, Paginator
+from django.test import TestCase, override_settings
+from django.urls import reverse, set_script_prefix
+
+from market.middleware import PROFILE_COMPLETE_SESSION_KEY
+from market.models import User, PostItem, Comment, Like
+from market.paginators import CachedCountPaginator, PkPaginator, UNSOLD_ITEMS_COUNT_CACHE_KEY
+
+
+@override_settings(
+    # Keep the tests' cache writes in memory instead of the shared file cache
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    # Render templates without the collected static files manifest
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    },
+)
+class MarketTestCase(TestCase):
+    """
+    Base test case with helpers to create users and items.
+    """
+
+    @staticmethod
+    def create_user(username, **extra_fields):
+        """
+        Create a user whose profile is complete unless told otherwise.
+        """
+        fields = {"nickname": username, "address": "Street 1", "city": "Essen, NRW"}
+        fields.update(extra_fields)
+        return User.objects.create_user(username, f"{username}@example.com", "Passw0rd!", **fields)
+
+    @staticmethod
+    def create_item(author, **extra_fields):
+        """
+        Create an item without uploading a file (the image name is stored as is).
+        """
+        fields = {
+            "item_title": "Item",
+            "item_price": 10,
+            "item_condition": 1,
+            "item_detail": "Detail",
+            "item_image1": "item_pics/test.png",
+            "item_author": author,
+        }
+        fields.update(extra_fields)
+        return PostItem.objects.create(**fields)
+
+
+class CounterSignalTests(MarketTestCase):
+    """
+    The signal-maintained 'likes_count' / 'comments_count' columns must always
+    match the number of related rows.
+    """
+
+    def setUp(self):
+        self.seller = self.create_user("seller")
+        self.buyer = self.create_user("buyer")
+        self.item = self.create_item(self.seller)
+
+    def assertCountersMatch(self, *objects):
+        """
+        Check each object's stored counters against a real COUNT(*).
+        """
+        for obj in objects:
+            obj.refresh_from_db()
+            self.assertEqual(obj.likes_count, obj.likes.count())
+            if isinstance(obj, PostItem):
+                self.assertEqual(obj.comments_count, obj.comments.count())
+
+    def test_like_and_unlike_item(self):
+        like = Like.objects.create(author=self.buyer, liked_object=self.item)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.likes_count, 1)
+
+        like.delete()
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.likes_count, 0)
+
+    def test_like_and_unlike_comment(self):
+        comment = Comment.objects.create(content="Hi", author=self.buyer, post_item=self.item)
+
+        Like.objects.create(author=self.seller, liked_object=comment)
+        self.assertCountersMatch(comment, self.item)
+        self.assertEqual(comment.likes_count, 1)
+        # Liking a comment doesn't touch the item's like counter
+        self.assertEqual(self.item.likes_count, 0)
+
+        Like.objects.filter(author=self.seller).delete()
+        self.assertCountersMatch(comment)
+        self.assertEqual(comment.likes_count, 0)
+
+    def test_like_toggle_view(self):
+        self.client.force_login(self.buyer)
+        url = reverse("process-like", args=["item", self.item.id])
+
+        response = self.client.post(url)
+        self.assertEqual(response.json(), {"liked": True, "like_count": 1})
+
+        response = self.client.post(url)
+        self.assertEqual(response.json(), {"liked": False, "like_count": 0})
+        self.assertCountersMatch(self.item)
+
+    def test_like_toggle_view_missing_object(self):
+        self.client.force_login(self.buyer)
+
+        for target in ("item", "comment"):
+            with self.subTest(target=target):
+                response = self.client.post(reverse("process-like", args=[target, 9999]))
+                self.assertEqual(response.status_code, 404)
+
+        self.assertFalse(Like.objects.exists())
+
+    def test_comment_create_and_delete(self):
+        comments = [
+            Comment.objects.create(content="Hi", author=self.buyer, post_item=self.item)
+            for _ in range(2)
+        ]
+        self.assertCountersMatch(self.item)
+        self.assertEqual(self.item.comments_count, 2)
+
+        comments[0].delete()
+        self.assertCountersMatch(self.item)
+        self.assertEqual(self.item.comments_count, 1)
+
+    def test_decrement_stops_at_zero(self):
+        like = Like.objects.create(author=self.buyer, liked_object=self.item)
+        # Counter out of sync (e.g. after a QuerySet.update())
+        PostItem.objects.filter(pk=self.item.pk).update(likes_count=0)
+
+        like.delete()
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.likes_count, 0)
+
+    def test_item_delete_cascades(self):
+        other_item = self.create_item(self.seller)
+        comment = Comment.objects.create(content="Hi", author=self.buyer, post_item=self.item)
+        Like.objects.create(author=self.buyer, liked_object=self.item)
+        Like.objects.create(author=self.seller, liked_object=comment)
+        Like.objects.create(author=self.buyer, liked_object=other_item)
+
+        self.item.delete()
+
+        self.assertFalse(Comment.objects.filter(pk=comment.pk).exists())
+        self.assertEqual(Like.objects.count(), 1)
+        # Counters of unrelated objects are left alone
+        self.assertCountersMatch(other_item)
+        self.assertEqual(other_item.likes_count, 1)
+
+    def test_user_delete_cascades(self):
+        comment = Comment.objects.create(content="Hi", author=self.seller, post_item=self.item)
+        Comment.objects.create(content="Hi", author=self.buyer, post_item=self.item)
+        Like.objects.create(author=self.buyer, liked_object=self.item)
+        Like.objects.create(author=self.buyer, liked_object=comment)
+        Like.objects.create(author=self.seller, liked_object=self.item)
+
+        self.buyer.delete()
+
+        self.assertCountersMatch(self.item, comment)
+        self.assertEqual(self.item.likes_count, 1)
+        self.assertEqual(self.item.comments_count, 1)
+        self.assertEqual(comment.likes_count, 0)
+
+
+class PkPaginatorTests(MarketTestCase):
+    """
+    PkPaginator must return the same pages as Django's Paginator.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        seller = cls.create_user("seller")
+        for i in range(7):
+            cls.create_item(seller, item_title=f"Item {i}")
+
+    def test_pages_match_default_paginator(self):
+        queryset = PostItem.objects.order_by("-dt_created", "-id")
+        expected = Paginator(queryset, 3, orphans=1)
+        paginator = PkPaginator(queryset, 3, orphans=1)
+
+        self.assertEqual(paginator.num_pages, expected.num_pages)
+        for number in expected.page_range:
+            with self.subTest(page=number):
+                self.assertEqual(
+                    list(paginator.page(number)), list(expected.page(number))
+                )
+
+    def test_out_of_range_page(self):
+        paginator = PkPaginator(PostItem.objects.order_by("-id"), 3)
+
+        with self.assertRaises(EmptyPage):
+            paginator.page(10)
+
+
+class CachedCountPaginatorTests(MarketTestCase):
+    """
+    CachedCountPaginator must reuse the cached count until the signals drop it.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.seller = self.create_user("seller")
+        self.create_item(self.seller)
+
+    def paginator(self):
+        return CachedCountPaginator(
+            PostItem.objects.filter(is_sold=False).order_by("-id"),
+            8,
+            count_cache_key=UNSOLD_ITEMS_COUNT_CACHE_KEY,
+        )
+
+    def test_count_is_cached(self):
+        self.assertEqual(self.paginator().count, 1)
+
+        # Rows changed behind the signals' back: the cached count is still used
+        PostItem.objects.update(is_sold=True)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.paginator().count, 1)
+
+    def test_item_changes_invalidate_count(self):
+        self.assertEqual(self.paginator().count, 1)
+
+        item = self.create_item(self.seller)
+        self.assertEqual(self.paginator().count, 2)
+
+        item.is_sold = True
+        item.save()
+        self.assertEqual(self.paginator().count, 1)
+
+        item.delete()
+        self.assertEqual(self.paginator().count, 1)
+
+    def test_without_cache_key(self):
+        paginator = CachedCountPaginator(PostItem.objects.order_by("-id"), 8)
+        self.assertEqual(paginator.count, 1)
+        self.assertIsNone(cache.get(UNSOLD_ITEMS_COUNT_CACHE_KEY))
+
+
+class ProfileRequiredMiddlewareTests(MarketTestCase):
+    """
+    Incomplete profiles are sent to 'profile-set'; complete ones are flagged
+    in the session so later requests skip the check.
+    """
+
+    def test_incomplete_profile_is_redirected(self):
+        self.client.force_login(self.create_user("newbie", nickname=None, address="", city=""))
+
+        response = self.client.get(reverse("home"))
+
+        self.assertRedirects(response, reverse("profile-set"))
+        self.assertNotIn(PROFILE_COMPLETE_SESSION_KEY, self.client.session)
+
+    def test_complete_profile_sets_session_flag(self):
+        self.client.force_login(self.create_user("seller"))
+
+        response = self.client.get(reverse("home"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIs(self.client.session[PROFILE_COMPLETE_SESSION_KEY], True)
+
+    def test_session_flag_skips_user_lookup(self):
+        user = self.create_user("seller")
+        self.client.force_login(user)
+        self.client.get(reverse("home"))
+
+        # The flag is trusted for the rest of the session
+        User.objects.filter(pk=user.pk).update(profile_complete=False)
+        response = self.client.get(reverse("home"))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_login_sets_session_flag(self):
+        self.create_user("seller")
+
+        self.client.post(
+            reverse("account_login"),
+            {"login": "seller@example.com", "password": "Passw0rd!"},
+        )
+
+        self.assertIs(self.client.session[PROFILE_COMPLETE_SESSION_KEY], True)
+
+    def test_profile_set_sets_session_flag(self):
+        self.client.force_login(self.create_user("newbie", nickname=None, address="", city=""))
+
+        response = self.client.post(
+            reverse("profile-set"),
+            {"nickname": "newbie", "address": "Street 1", "city": "Essen, NRW", "intro": ""},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIs(self.client.session[PROFILE_COMPLETE_SESSION_KEY], True)
+
+    def test_exempt_paths_under_script_prefix(self):
+        self.client.force_login(self.create_user("newbie", nickname=None, address="", city=""))
+
+        # Deployed under a sub-path: request.path includes SCRIPT_NAME.
+        # The test client doesn't set the script prefix itself (WSGIHandler does),
+        # and only after the middleware was created at startup.
+        self.client.get("/")
+        set_script_prefix("/market/")
+        self.addCleanup(set_script_prefix, "/")
+
+        response = self.client.get("/set-profile/", SCRIPT_NAME="/market")
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/", SCRIPT_NAME="/market")
+        self.assertRedirects(response, "/market/set-profile/", fetch_redirect_response=False)
+
+
+class NicknameConflictTests(MarketTestCase):
+    """
+    A taken nickname is reported as a form error without changing the user
+    or leaving the uploaded profile picture in storage.
+    """
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media_settings = self.settings(MEDIA_ROOT=self.media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        self.create_user("alice")
+        self.bob = self.create_user("bob")
+
+    def test_duplicate_nickname_with_upload(self):
+        self.client.force_login(self.bob)
+        image = io.BytesIO()
+        Image.new("RGB", (2, 2)).save(image, "PNG")
+
+        response = self.client.post(
+            reverse("profile-update"),
+            {
+                "nickname": "alice",
+                "address": "Street 2",
+                "city": "Essen, NRW",
+                "intro": "",
+                "profile_pic": SimpleUploadedFile("orphan.png", image.getvalue(), "image/png"),
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFormError(response.context["form"], "nickname", "This nickname is already taken.")
+
+        self.bob.refresh_from_db()
+        self.assertEqual(self.bob.nickname, "bob")
+        self.assertEqual(self.bob.address, "Street 1")
+        self.assertFalse(self.bob.profile_pic)
+
+        stored_files = [files for _, _, files in os.walk(self.media_root) if files]
+        self.assertEqual(stored_files, [])
+
+
+class IndexPageCacheTests(MarketTestCase):
+    """
+    Anonymous index pages are served from the cache until an item changes.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.seller = self.create_user("seller")
+        self.item = self.create_item(self.seller, item_title="First")
+
+    def test_second_anonymous_hit_is_cached(self):
+        self.client.get(reverse("home"))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("home"))
+        self.assertContains(response, "First")
+
+    def test_unrelated_query_parameters_share_the_cached_page(self):
+        self.client.get(reverse("home"))
+
+        with self.assertNumQueries(0):
+            self.client.get(reverse("home"), {"x": "random", "page": "01"})
+
+    def test_item_save_invalidates_cached_page(self):
+        self.client.get(reverse("home"))
+
+        self.item.item_title = "Renamed"
+        self.item.save()
+
+        response = self.client.get(reverse("home"))
+        self.assertContains(response, "Renamed")
+        self.assertNotContains(response, "First")
+
+    def test_logged_in_users_bypass_cache(self):
+        self.client.get(reverse("home"))
+        # Changed without signals: only a fresh render shows the new title
+        PostItem.objects.filter(pk=self.item.pk).update(item_title="Renamed")
+
+        self.client.force_login(self.seller)
+        response = self.client.get(reverse("home"))
+
+        self.assertContains(response, "Renamed")
@@ -1,5 +1,11 @@
-from django.urls import path
+from django.urls import include, path, register_converter
+from django.views.decorators.http import require_POST
 from . import views
+from .converters import LikeTargetConverter
+
+
+# <like_target:...> matches "item" or "comment" and passes the model class to the view
+register_converter(LikeTargetConverter, "like_target")
 
 
 # URL configuration for the market app
@@ -10,17 +16,22 @@ urlpatterns = [
     # Home page: shows the list of all items using IndexView
     path("", views.IndexView.as_view(), name="home"),
     
-    # Detail page: shows a single item by its ID using ItemDetailView
-    path("item/<int:id>/", views.ItemDetailView.as_view(), name="item-detail"),
+    # Item pages share the "item/" prefix, so they live in one subtree: a
+    # request outside "item/" skips all four patterns with a single check
+    path("item/", include([
 
-    # Create page: shows a form to create a new item using ItemCreateView
-    path("item/create/", views.ItemCreateView.as_view(), name="item-create"),
+        # Detail page: shows a single item by its ID using ItemDetailView
+        path("<int:id>/", views.ItemDetailView.as_view(), name="item-detail"),
 
-    # Update page: shows a form to edit an existing item using ItemUpdateView
-    path("item/<int:id>/edit/", views.ItemUpdateView.as_view(), name="item-update"),
-    
-    # Delete page: handles deleting an existing item using ItemDeleteView
-    path("item/<int:id>/delete/", views.ItemDeleteView.as_view(), name="item-delete"),
+        # Create page: shows a form to create a new item using ItemCreateView
+        path("create/", views.ItemCreateView.as_view(), name="item-create"),
+
+        # Update page: shows a form to edit an existing item using ItemUpdateView
+        path("<int:id>/edit/", views.ItemUpdateView.as_view(), name="item-update"),
+
+        # Delete page: handles deleting an existing item using ItemDeleteView
+        path("<int:id>/delete/", views.ItemDeleteView.as_view(), name="item-delete"),
+    ])),
 
 
 
@@ -41,15 +52,20 @@ urlpatterns = [
 
     # ========== Urls about Comment ==========
     
-    # Comment update: handles updating an existing comment using CommentUpdateView
-    path("comment/<int:comment_id>/edit/", views.CommentUpdateView.as_view(), name="comment-update"),
+    # Both comment actions hang off the same "comment/<id>/" prefix
+    path("comment/<int:comment_id>/", include([
+
+        # Comment update: handles updating an existing comment using CommentUpdateView
+        path("edit/", views.CommentUpdateView.as_view(), name="comment-update"),
 
-    # Comment delete: handles deleting an existing comment using CommentDeleteView
-    path("comment/<int:comment_id>/delete/", views.CommentDeleteView.as_view(), name="comment-delete"),
+        # Comment delete: handles deleting an existing comment using CommentDeleteView
+        path("delete/", views.CommentDeleteView.as_view(), name="comment-delete"),
+    ])),
     
     
     # ========== Urls about Like ==========
     
-    # Process like: handles toggling a like via AJAX POST request using ProcessLikeView
-    path("like/<int:content_type_id>/<int:object_id>/", views.ProcessLikeView.as_view(), name="process-like"),
+    # Process like: handles toggling a like via AJAX POST request using ProcessLikeView.
+    # require_POST answers other methods with 405 before the view and its login check run.
+    path("like/<like_target:target>/<int:object_id>/", require_POST(views.ProcessLikeView.as_view()), name="process-like"),
 ]
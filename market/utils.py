@@ -1,42 +1,137 @@
+import hashlib
+import time
+from functools import lru_cache
+
 from django.utils import timezone
-from django.utils.text import slugify
+from django.core.cache import cache
 
+from django.contrib.contenttypes.models import ContentType
 from django.shortcuts import redirect
+from django.urls import reverse
 from allauth.account.models import EmailAddress
 
 
-def item_image_upload_to(instance, filename):
+@lru_cache(maxsize=None)
+def cached_reverse(viewname):
     """
-    Build the upload path for item images based on the post author and creation month.
+    Resolve a URL name that takes no arguments, caching the result per process.
 
-    Resulting path pattern:
-    media/item_pics/<nickname-or-email-local-part>/<year-month>/<filename>
+    - Static routes such as 'home' or 'profile-set' always resolve to the same
+        path, so the URL resolver only needs to be walked once.
+    - Use cached_reverse_id() for routes keyed by an 'id'.
+    """
+    return reverse(viewname)
 
-    Example:
-    item_pics/podo-user/202511/my_photo.jpg
+
+@lru_cache(maxsize=4096)
+def cached_reverse_id(viewname, id):
+    """
+    Resolve a URL name that takes a single 'id' kwarg, caching recent results.
+
+    - Used for per-object routes such as 'item-detail' or 'profile', whose
+        path only depends on the ID.
+    - Bounded by an LRU so the cache cannot grow with the number of rows.
+    """
+    return reverse(viewname, kwargs={"id": id})
+
+
+def content_type_id(model):
+    """
+    Return the ContentType id for a model class or instance.
+
+    - Served from ContentTypeManager's per-process cache after the first
+        lookup, unlike ContentType.objects.get(model=...) which queries every time.
+    - config/wsgi.py warms the cache for the likeable models when a worker
+        starts; any other model is resolved lazily on first use.
+    """
+    return ContentType.objects.get_for_model(model).id
+
+
+# Cache key holding the current generation of cached anonymous index pages.
+# Bumped by the PostItem signals, which orphans every page cached before.
+INDEX_PAGE_VERSION_CACHE_KEY = "market:index-page-version"
+
+
+def index_page_cache_key(page, search_keyword):
+    """
+    Return the cache key for an anonymous index page.
+
+    - Built only from the values the page depends on (page number and search
+        keyword), so unrelated query parameters can't create new entries.
+    - Numeric page numbers are normalized ("01" -> "1", missing -> "1").
+    - Includes the current page generation, so bumping it invalidates all
+        cached pages at once without having to know their keys.
+    - The keyword is hashed to keep keys short whatever the search query.
+    """
+    page = page or "1"
+    if page.isascii() and page.isdigit():
+        page = str(int(page))
+
+    version = cache.get_or_set(INDEX_PAGE_VERSION_CACHE_KEY, 0, None)
+    digest = hashlib.md5(search_keyword.encode(), usedforsecurity=False).hexdigest()
+    return f"market:index-page:{version}:{page}:{digest}"
+
+
+def bump_index_page_version():
+    """
+    Start a new generation of cached anonymous index pages.
+    """
+    try:
+        cache.incr(INDEX_PAGE_VERSION_CACHE_KEY)
+    except ValueError:
+        # Key missing (never set or evicted): any new value starts a fresh generation
+        cache.set(INDEX_PAGE_VERSION_CACHE_KEY, int(time.time()), None)
+
+
+# (UTC day number, month folder) of the last _month_folder() computation
+_month_folder_cache = (None, "")
+
+
+def _month_folder():
     """
-    author = instance.item_author
+    Return the current year+month (e.g. "202511") used as the upload date subfolder.
 
-    # Priority 1: use the user's nickname if available
-    if author.nickname:
-        base_name = author.nickname
+    - Built from the datetime's integer fields instead of strftime(),
+        which would parse a format string on every call.
+    - Recomputed once per UTC day: timezone.now() is UTC (USE_TZ = True),
+        so the month can only change at a day boundary.
+    """
+    global _month_folder_cache
 
-    # Priority 2: fall back to username
-    elif author.username:
-        base_name = author.username
+    day = int(time.time()) // 86400
+    cached_day, folder = _month_folder_cache
+    if cached_day != day:
+        now = timezone.now()
+        folder = f"{now.year}{now.month:02d}"
+        _month_folder_cache = (day, folder)
+    return folder
 
-    # Fallback name if both nickname and username are unexpectedly missing
-    else:
-        base_name = "user"
 
-    # Convert the base name into a filesystem- and URL-safe slug
-    folder_name = slugify(base_name)
+def item_image_upload_to(instance, filename):
+    """
+    Build the upload path for item images based on the post author and creation month.
+
+    Resulting path pattern:
+    media/item_pics/<nickname-or-email-local-part>/<year-month>/<hash-prefix>/<filename>
+
+    Example:
+    item_pics/podo-user/202511/3f/my_photo.jpg
+
+    The 2-character hash prefix (256 buckets) keeps busy sellers' monthly
+    folders from growing into one huge directory. Files uploaded before
+    the prefix was introduced keep their stored paths.
+    """
+    # Slug of the author's nickname (or username), cached on the user row
+    folder_name = instance.item_author.slug or "user"
 
     # Use current year+month (e.g. "202511") as a subfolder for upload date
-    month_folder = timezone.now().strftime("%Y%m")
+    month_folder = _month_folder()
+
+    # Bucket subfolder derived from the file name (00-ff)
+    bucket = hashlib.blake2b(filename.encode(), digest_size=1).hexdigest()
 
     # Final upload path relative to MEDIA_ROOT
-    return f"item_pics/{folder_name}/{month_folder}/{filename}"
+    return f"item_pics/{folder_name}/{month_folder}/{bucket}/{filename}"
 
 
 def profile_image_upload_to(instance, filename):
@@ -50,34 +145,28 @@ def profile_image_upload_to(instance, filename):
     profile_pics/podo-user/202511/my_profile_photo.jpg
     """
 
-    # Priority 1: use the user's nickname if available
-    if instance.nickname:
-        base_name = instance.nickname
-
-    # Priority 2: fall back to username
-    elif instance.username:
-        base_name = instance.username
-
-    # Fallback name if both nickname and username are unexpectedly missing
-    else:
-        base_name = "user"
-
-    # Convert the base name into a filesystem- and URL-safe slug
-    folder_name = slugify(base_name)
+    # Slug of the nickname (or username), kept up to date by User.save()
+    folder_name = instance.slug or "user"
 
     # Use current year+month (e.g. "202511") as a subfolder for upload date
-    month_folder = timezone.now().strftime("%Y%m")
+    month_folder = _month_folder()
 
     # Final upload path relative to MEDIA_ROOT
     return f"profile_pics/{folder_name}/{month_folder}/{filename}"
 
 
+# Minimum number of seconds between two confirmation emails for the same
+# address when an unverified user keeps hitting protected views
+CONFIRMATION_RESEND_COOLDOWN = 3 * 60
+
+
 def confirmation_required_redirect(self, request):
     """
     Custom redirect callback used with UserPassesTestMixin.raise_exception.
 
     - Ensures the logged-in user has a primary EmailAddress object.
-    - If the email is not verified yet, sends a confirmation email.
+    - If the email is not verified yet, sends a confirmation email, at most
+        once per CONFIRMATION_RESEND_COOLDOWN seconds per address.
     - Finally redirects to the 'email confirmation required' page.
     """
     user = request.user
@@ -89,9 +178,15 @@ def confirmation_required_redirect(self, request):
         defaults={"primary": True},
     )
 
-    # If the email is not verified yet, send a confirmation email
-    if not email_address.verified:
+    # If the email is not verified yet, send a confirmation email.
+    # Every blocked request lands here, so cache.add() (which only succeeds
+    # when the key is absent) lets one send through per cooldown window;
+    # repeat hits redirect straight away instead of waiting on SMTP again,
+    # and the link in the mail already sent stays valid.
+    if not email_address.verified and cache.add(
+        f"confirmation-sent:{email_address.pk}", True, CONFIRMATION_RESEND_COOLDOWN
+    ):
         email_address.send_confirmation(request)
 
     # Redirect the user to the information page
-    return redirect("account_email_confirmation_required")
+    return redirect(cached_reverse("account_email_confirmation_required"))
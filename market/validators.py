@@ -1,49 +1,23 @@
 import string
 from django.core.exceptions import ValidationError
 
+# Punctuation characters as a set: O(1) membership test per character
+# instead of scanning the 32-character string.punctuation each time
+PUNCTUATION_CHARS = frozenset(string.punctuation)
+
+# ASCII character classes, used when the whole password is ASCII
+ASCII_UPPERCASE_CHARS = frozenset(string.ascii_uppercase)
+ASCII_LOWERCASE_CHARS = frozenset(string.ascii_lowercase)
+ASCII_DIGIT_CHARS = frozenset(string.digits)
+
 
 def contains_special_character(value):
     """
     Check if the given value contains at least one special (punctuation) character.
     Returns True if a special character is found, otherwise False.
     """
-    for char in value:
-        if char in string.punctuation:
-            return True
-    return False
-
-
-def contains_uppercase_letter(value):
-    """
-    Check if the given value contains at least one uppercase letter (A–Z).
-    Returns True if an uppercase letter is found, otherwise False.
-    """
-    for char in value:
-        if char.isupper():
-            return True
-    return False
-
-
-def contains_lowercase_letter(value):
-    """
-    Check if the given value contains at least one lowercase letter (a–z).
-    Returns True if a lowercase letter is found, otherwise False.
-    """
-    for char in value:
-        if char.islower():
-            return True
-    return False
-
-
-def contains_number(value):
-    """
-    Check if the given value contains at least one numeric digit (0–9).
-    Returns True if a digit is found, otherwise False.
-    """
-    for char in value:
-        if char.isdigit():
-            return True
-    return False
+    # isdisjoint() walks the value in C and stops at the first match
+    return not PUNCTUATION_CHARS.isdisjoint(value)
 
 
 class CustomPasswordValidator:
@@ -61,13 +35,36 @@ class CustomPasswordValidator:
         Called by Django when validating a password.
         Raises ValidationError if the password does not meet the requirements.
         """
-        if (
-            len(password) < 8
-            or not contains_uppercase_letter(password)
-            or not contains_lowercase_letter(password)
-            or not contains_number(password)
-            or not contains_special_character(password)
-        ):
+        has_upper = has_lower = has_digit = has_special = False
+        if len(password) >= 8:
+            if password.isascii():
+                # ASCII-only (the common case): str.isupper() etc. agree with plain
+                # set membership here, so compare the distinct characters against
+                # each class in C and stop at the first missing one
+                chars = frozenset(password)
+                has_upper = not chars.isdisjoint(ASCII_UPPERCASE_CHARS)
+                has_lower = has_upper and not chars.isdisjoint(ASCII_LOWERCASE_CHARS)
+                has_digit = has_lower and not chars.isdisjoint(ASCII_DIGIT_CHARS)
+                has_special = has_digit and not chars.isdisjoint(PUNCTUATION_CHARS)
+            else:
+                # Walk the password once, recording which character classes appear,
+                # and stop as soon as all four have been seen
+                for char in password:
+                    if char.isupper():
+                        has_upper = True
+                    elif char.islower():
+                        has_lower = True
+                    elif char.isdigit():
+                        has_digit = True
+                    elif char in PUNCTUATION_CHARS:
+                        has_special = True
+                    else:
+                        continue
+
+                    if has_upper and has_lower and has_digit and has_special:
+                        break
+
+        if not (has_upper and has_lower and has_digit and has_special):
             # Raise an error if the password does not meet the required complexity
             raise ValidationError(
                 "Password must be at least 8 characters long and include uppercase letters, "
@@ -113,8 +110,9 @@ def validate_image_mime_type(value):
     # Try to read the MIME type from the uploaded file (may be empty in some cases)
     raw_mime = getattr(value, "content_type", "") or ""
     
-    # Normalize the MIME type: remove any parameters (e.g. "; charset=binary") and lowercase it
-    mime = raw_mime.split(";")[0].lower()
+    # Normalize the MIME type: remove any parameters (e.g. "; charset=binary") and lowercase it.
+    # partition() stops at the first ";" instead of splitting the whole string into a list
+    mime = raw_mime.partition(";")[0].lower()
 
     # If no MIME type is available, skip this check and let other validators handle the file
     if not mime:
@@ -1,19 +1,20 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.urls import reverse
 
 from allauth.account.views import PasswordChangeView
-from allauth.account.models import EmailAddress
 from django.views import View
-from django.http import JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse
+from django.core.cache import cache
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from braces.views import LoginRequiredMixin, UserPassesTestMixin
 from django.views.generic.edit import FormMixin
-from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import Max, Prefetch, Q, prefetch_related_objects
 
 from market.models import PostItem, User, Comment, Like
 from market.forms import PostItemCreateForm, PostItemUpdateForm , ProfileForm, CommentForm
-from market.utils import confirmation_required_redirect
+from market.utils import cached_reverse, cached_reverse_id, confirmation_required_redirect, content_type_id, index_page_cache_key
+from market.middleware import PROFILE_COMPLETE_SESSION_KEY
+from market.paginators import CachedCountPaginator, PkPaginator, UNSOLD_ITEMS_COUNT_CACHE_KEY
 
 
 class CustomPasswordChangeView(LoginRequiredMixin, PasswordChangeView):
@@ -31,7 +32,7 @@ class CustomPasswordChangeView(LoginRequiredMixin, PasswordChangeView):
 
         - Redirects to the profile detail page for the current user.
         """
-        return reverse("profile", kwargs=(({"id": self.request.user.id})))
+        return cached_reverse_id("profile", self.request.user.id)
 
 
 class IndexView(ListView):
@@ -62,6 +63,38 @@ class IndexView(ListView):
     # Number of items displayed per page
     paginate_by = 8
 
+    # Slices primary keys first and caches the unsold item count (see get_paginator)
+    paginator_class = CachedCountPaginator
+
+    # Seconds a rendered page is reused for anonymous visitors (see get)
+    anonymous_cache_timeout = 30
+
+    def get(self, request, *args, **kwargs):
+        """
+        Render the index page, serving anonymous visitors from a short-lived cache.
+
+        - Every anonymous visitor gets the same HTML for a given page number
+            and search keyword, so the rendered page is cached per pair
+            (other query parameters are ignored).
+        - Cached pages are dropped whenever an item is saved or deleted
+            (see market.signals); logged-in users always get a fresh page.
+        """
+        if request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
+
+        cache_key = index_page_cache_key(
+            request.GET.get(self.page_kwarg, ""), request.GET.get("q", "")
+        )
+        content = cache.get(cache_key)
+        if content is not None:
+            return HttpResponse(content)
+
+        response = super().get(request, *args, **kwargs)
+        response.render()
+        if response.status_code == 200:
+            cache.set(cache_key, response.content, self.anonymous_cache_timeout)
+        return response
+
     def get_queryset(self):
         """
         Return the queryset for the index page.
@@ -69,9 +102,10 @@ class IndexView(ListView):
         - Filters out items that are already sold (is_sold=True).
         - [Updated] Applies search filter if 'q' parameter exists in URL.
         - Search Scope: Matches keyword in 'item_title' OR 'item_detail'.
-        - Default ordering (-dt_created) is applied by the model.
+        - Default ordering (-dt_created, -id) is applied by the model.
         """
-        queryset = PostItem.objects.filter(is_sold=False)
+        # listing(): only the columns the item cards render
+        queryset = PostItem.objects.listing().filter(is_sold=False)
 
         search_keyword = self.request.GET.get("q", "")
 
@@ -83,6 +117,19 @@ class IndexView(ListView):
         
         return queryset
 
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """
+        Return the paginator for the index page.
+
+        - Without a search keyword the list is always "all unsold items", so
+            its COUNT(*) is cached (and dropped by the PostItem signals).
+        - Search results are counted per request.
+        """
+        if not self.request.GET.get("q", ""):
+            kwargs["count_cache_key"] = UNSOLD_ITEMS_COUNT_CACHE_KEY
+
+        return super().get_paginator(queryset, per_page, orphans, allow_empty_first_page, **kwargs)
+
     def get_context_data(self, **kwargs):
         """
         Extend context to include the current search keyword.
@@ -122,18 +169,62 @@ class ItemDetailView(LoginRequiredMixin, FormMixin, DetailView):
     # The form class to use for comment submission (processed by FormMixin)
     form_class = CommentForm 
 
+    def get_queryset(self):
+        """
+        Return the queryset used to look up the item.
+
+        - detail(): skips 'dt_updated' and the seller's unused columns
+            (password hash, email, intro, ...).
+        - The comments are prefetched in get_context_data(), so a valid
+            comment POST (which only redirects) doesn't load them.
+        """
+        return PostItem.objects.detail()
+
     def get_context_data(self, **kwargs):
         """
         Extend the default context with the comment form.
 
-        - Adds 'form' to the context so it can be rendered in the template.
-        - Uses self.get_form() to ensure the form is correctly instantiated
-            (with data on POST, empty on GET).
-        """
+        - 'form' is added by FormMixin.get_context_data(): a new empty form on
+            GET, and on an invalid POST the already validated form passed in by
+            form_invalid() (building another one would validate it again).
+        - Prefetches the comments together with their authors, so the comment
+            list renders from one extra query instead of one query per author.
+        - Adds the current user's like/comment state for the item and the ids
+            of the comments they liked, so the template does set lookups
+            instead of one query per object.
+        """
+        # Only needed when the page is rendered (GET or an invalid comment POST)
+        prefetch_related_objects(
+            [self.object],
+            Prefetch("comments", queryset=Comment.objects.select_related("author")),
+        )
         context =  super().get_context_data(**kwargs)
-        context["form"] = self.get_form()
-        context['postitem_ctype_id'] = ContentType.objects.get(model='postitem').id
-        context['comment_ctype_id'] = ContentType.objects.get(model='comment').id
+        # ContentType ids come from the manager's per-process cache (no query after the first)
+        postitem_ctype_id = content_type_id(PostItem)
+        comment_ctype_id = content_type_id(Comment)
+
+        postitem = self.object
+        user = self.request.user
+
+        # Everything the current user liked on this page (the item and its comments),
+        # fetched in one query instead of one query per object
+        liked = set(
+            Like.objects.filter(author=user)
+            .filter(
+                Q(content_type_id=postitem_ctype_id, object_id=postitem.id)
+                | Q(content_type_id=comment_ctype_id, object_id__in=postitem.comments.values("id"))
+            )
+            .values_list("content_type_id", "object_id")
+        )
+        context["user_liked_item"] = (postitem_ctype_id, postitem.id) in liked
+        context["liked_comment_ids"] = {
+            object_id for ctype_id, object_id in liked if ctype_id == comment_ctype_id
+        }
+        # Answered from the prefetched comments (no extra EXISTS query)
+        context["user_commented_item"] = any(
+            comment.author_id == user.id for comment in postitem.comments.all()
+        )
+
         return context
 
     def get_success_url(self):
@@ -142,7 +233,7 @@ class ItemDetailView(LoginRequiredMixin, FormMixin, DetailView):
 
         - Redirects back to the current item's detail page.
         """
-        return reverse("item-detail", kwargs={"id": self.object.id})
+        return cached_reverse_id("item-detail", self.object.id)
 
     def post(self, request, *args, **kwargs):
         """
@@ -222,7 +313,7 @@ class ItemCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
 
         - Redirects to the item detail page using the newly created object's ID.
         """
-        return reverse("item-detail", kwargs={"id": self.object.id})
+        return cached_reverse_id("item-detail", self.object.id)
 
     def test_func(self, user):
         """
@@ -232,9 +323,28 @@ class ItemCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         - If this returns False, the view uses confirmation_required_redirect
             instead of rendering the form.
         """
-        return EmailAddress.objects.filter(user=user, verified=True).exists()
+        # Denormalized on the user row (see market.signals), so no extra query
+        return user.email_verified
+
+class CachedObjectMixin:
+    """
+    Mixin for single-object views that looks the object up only once per request.
 
-class ItemUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+    - UserPassesTestMixin.test_func() and the view's get()/post() both call
+        get_object(); without this each call runs the same SELECT again.
+    - Only the default lookup (queryset=None) is cached.
+    """
+
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+
+        if getattr(self, "_cached_object", None) is None:
+            self._cached_object = super().get_object()
+        return self._cached_object
+
+
+class ItemUpdateView(LoginRequiredMixin, UserPassesTestMixin, CachedObjectMixin, UpdateView):
     """
     Class-based update view for editing an existing PostItem.
 
@@ -270,7 +380,7 @@ class ItemUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
 
         - Redirects to the item detail page using the updated object's ID.
         """
-        return reverse("item-detail", kwargs={"id": self.object.id})
+        return cached_reverse_id("item-detail", self.object.id)
 
     def test_func(self, user):
         """
@@ -282,7 +392,7 @@ class ItemUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         return post_item.item_author == user
 
 
-class ItemDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class ItemDeleteView(LoginRequiredMixin, UserPassesTestMixin, CachedObjectMixin, DeleteView):
     """
     Class-based delete view for removing an existing PostItem.
 
@@ -314,7 +424,7 @@ class ItemDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
 
         - Redirects to the home page that lists all items.
         """
-        return reverse("home")
+        return cached_reverse("home")
 
     def test_func(self, user):
         """
@@ -363,34 +473,25 @@ class ProfileView(DetailView):
         profile_user = self.object
 
         # 1. Latest 4 items posted by this user (using PostItem default ordering)
-        context["user_postitems"] = profile_user.posts.all()[:4]
+        # listing(): only the columns the item cards render (same for 2. and 3.)
+        context["user_postitems"] = profile_user.posts.listing()[:4]
 
         # 2. Latest 4 items liked by this user
         # Uses GenericRelation reverse lookup, ordered by when the like was created
-        context["liked_postitems"] = PostItem.objects.filter(
+        context["liked_postitems"] = PostItem.objects.listing().filter(
             likes__author=profile_user
         ).order_by("-likes__dt_created")[:4]
 
         # 3. Latest 4 items commented on by this user
-        # First, fetch items connected via comments
-        commented_posts = PostItem.objects.filter(
-            comments__author=profile_user
-        ).order_by("-comments__dt_created")
-
-        # Manual deduplication to show each post only once
-        # (Avoids DB-specific issues with distinct() + order_by())
-        seen = set()
-        unique_commented_posts = []
-        for post in commented_posts:
-            if post.id not in seen:
-                unique_commented_posts.append(post)
-                seen.add(post.id)
-
-            # Stop once we collected 4 unique items
-            if len(unique_commented_posts) >= 4:
-                break
-
-        context["commented_postitems"] = unique_commented_posts
+        # Each item appears once, ordered by the user's latest comment on it.
+        # The Max() aggregate only covers this user's comments (the annotation
+        # reuses the filtered join), so the DB returns at most 4 rows instead
+        # of one row per comment to deduplicate in Python.
+        context["commented_postitems"] = (
+            PostItem.objects.listing().filter(comments__author=profile_user)
+            .annotate(last_commented=Max("comments__dt_created"))
+            .order_by("-last_commented", "-id")[:4]
+        )
 
         return context
 
@@ -419,6 +520,9 @@ class UserPostItemListView(ListView):
     # Number of PostItem objects per page
     paginate_by = 8
 
+    # Slices primary keys first, then loads only the rows of the requested page
+    paginator_class = PkPaginator
+
     def get_queryset(self):
         """
         Return the queryset of PostItem objects for the given user.
@@ -431,8 +535,9 @@ class UserPostItemListView(ListView):
         # raise 404 if no such user exists.
         self.profile_user = get_object_or_404(User, pk=self.kwargs.get("id"))
 
-        # Return all posts authored by this user, newest first
-        return self.profile_user.posts.all()
+        # Return all posts authored by this user, newest first,
+        # loading only the columns the item cards render
+        return self.profile_user.posts.listing()
 
     def get_context_data(self, **kwargs):
         """
@@ -450,7 +555,35 @@ class UserPostItemListView(ListView):
         return context
 
 
-class ProfileSetView(LoginRequiredMixin, UpdateView):
+class NicknameConflictMixin:
+    """
+    Mixin for profile edit views that turns a duplicate-nickname
+    IntegrityError into a regular form error.
+
+    - ProfileForm does not query for taken nicknames; the unique index on
+        User.nickname is the only check, so duplicates show up here.
+    - The save runs in its own atomic block so the failed INSERT/UPDATE does
+        not break the surrounding transaction.
+    - A profile picture uploaded with the rejected submit is deleted again.
+    """
+
+    def form_valid(self, form):
+        try:
+            with transaction.atomic():
+                return super().form_valid(form)
+        except IntegrityError:
+            # The upload was written to storage before the failed UPDATE:
+            # remove it so rejected submits don't leave orphaned files behind
+            if "profile_pic" in form.changed_data and form.instance.profile_pic:
+                form.instance.profile_pic.delete(save=False)
+
+            # Drop the unsaved values so the page (navbar etc.) shows the stored user
+            form.instance.refresh_from_db()
+            form.add_error("nickname", "This nickname is already taken.")
+            return self.form_invalid(form)
+
+
+class ProfileSetView(LoginRequiredMixin, NicknameConflictMixin, UpdateView):
     """
     View for editing the currently logged-in user's profile.
 
@@ -477,6 +610,20 @@ class ProfileSetView(LoginRequiredMixin, UpdateView):
         """
         return self.request.user
 
+    def form_valid(self, form):
+        """
+        Save the profile and flag the session once the profile is complete.
+
+        - The flag lets ProfileRequiredMiddleware skip its profile check
+            (and loading the user) on the following requests.
+        """
+        response = super().form_valid(form)
+
+        if not form.errors and self.object.profile_complete:
+            self.request.session[PROFILE_COMPLETE_SESSION_KEY] = True
+
+        return response
+
     def get_success_url(self):
         """
         Where to redirect after a successful profile update.
@@ -484,10 +631,10 @@ class ProfileSetView(LoginRequiredMixin, UpdateView):
         - Here we redirect to 'home', but you can change it to 'profile'
             if you want to go back to the profile detail page instead.
         """
-        return reverse("home")
+        return cached_reverse("home")
 
 
-class ProfileUpdateView(LoginRequiredMixin, UpdateView):
+class ProfileUpdateView(LoginRequiredMixin, NicknameConflictMixin, UpdateView):
     """
     View for editing the currently logged-in user's profile.
 
@@ -521,10 +668,10 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
 
         - Redirects to the 'profile' detail page of the current user.
         """
-        return reverse("profile", kwargs=(({"id": self.request.user.id})))
+        return cached_reverse_id("profile", self.request.user.id)
 
 
-class CommentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class CommentUpdateView(LoginRequiredMixin, UserPassesTestMixin, CachedObjectMixin, UpdateView):
     """
     View for updating an existing comment.
 
@@ -544,7 +691,7 @@ class CommentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         - Since comment editing happens via a hidden form on the detail page,
             direct access to the edit URL is unnecessary and blocked.
         """
-        return redirect("item-detail", id=self.get_object().post_item.id)
+        return redirect(cached_reverse_id("item-detail", self.get_object().post_item_id))
 
     def get_success_url(self):
         """
@@ -552,16 +699,17 @@ class CommentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
 
         - Redirects back to the related PostItem detail page.
         """
-        return reverse("item-detail", kwargs={"id": self.object.post_item.id})
+        return cached_reverse_id("item-detail", self.object.post_item_id)
 
     def test_func(self, user):
         """
         Permission check: Only the author of the comment can update it.
         """
-        return self.get_object().author == user
+        # Compare ids, so the author row is not loaded just for this check
+        return self.get_object().author_id == user.pk
 
 
-class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, CachedObjectMixin, DeleteView):
     """
     View for deleting an existing comment.
 
@@ -580,7 +728,7 @@ class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
         - Deletion should be performed via POST for security.
         - Direct access to this URL via GET is blocked.
         """
-        return redirect("item-detail", id=self.get_object().post_item.id)
+        return redirect(cached_reverse_id("item-detail", self.get_object().post_item_id))
 
     def get_success_url(self):
         """
@@ -588,13 +736,13 @@ class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
 
         - Redirects back to the related PostItem detail page.
         """
-        return reverse("item-detail", kwargs={"id": self.object.post_item.id})
+        return cached_reverse_id("item-detail", self.object.post_item_id)
 
     def test_func(self, user):
         """
         Permission check: Only the author of the comment can delete it.
         """
-        return self.get_object().author == user
+        return self.get_object().author_id == user.pk
 
 
 class ProcessLikeView(LoginRequiredMixin, View):
@@ -602,44 +750,70 @@ class ProcessLikeView(LoginRequiredMixin, View):
     Class-based view for handling 'Like' toggles via AJAX POST requests.
 
     - Requires the user to be logged in (via LoginRequiredMixin).
-    - Only accepts POST requests (http_method_name = ["post"]).
-    - Toggles the like status: creates a Like if it doesn't exist, deletes it if it does.
+    - Only accepts POST requests (http_method_names = ["post"]; the URL is
+        also wrapped in require_POST so other methods never reach the view).
+    - Toggles the like status: deletes the Like if it exists, creates it if it doesn't.
     - Returns a JsonResponse with the new like status and total count,
         allowing the frontend to update the UI without a page reload.
     """
 
-    http_method_name = ["post"]
+    http_method_names = ["post"]
 
     def post(self, request, *args, **kwargs):
         """
         Handle the POST request to toggle a like.
 
-        - Retrieves the content type and object ID from the URL kwargs.
-        - Uses get_or_create to either find an existing like or create a new one.
-        - If the like already existed (not created), it is deleted (unlike).
-        - Calculates the new total like count for the object.
+        - The URL converter has already turned 'target' ("item"/"comment")
+            into the model class; its ContentType id comes from the
+            per-process cache.
+        - Reads the liked object's 'likes_count' column first and returns
+            404 if the object doesn't exist, so no Like is written for it.
+        - Deletes the user's like first; if nothing was deleted, creates it
+            instead (like), otherwise the toggle was an unlike.
+        - Returns the stored count adjusted by the toggle, which is what the
+            Like signals write to the column, instead of a COUNT(*).
         - Returns JSON data containing:
             - 'liked': Boolean indicating if the user currently likes the item.
             - 'like_count': The updated total number of likes.
         """
-        content_type_id = self.kwargs.get("content_type_id")
-        object_id = self.kwargs.get("object_id")
-
-        like, created = Like.objects.get_or_create(
-            author=self.request.user,
-            content_type_id=self.kwargs.get("content_type_id"),
-            object_id=self.kwargs.get("object_id"),
-        )
-
-        if not created:
-            like.delete()
-            liked = False
-        else:
-            liked = True
-
-        like_count = Like.objects.filter(
-            content_type_id=content_type_id, object_id=object_id
-        ).count()
+        model = self.kwargs["target"]
+
+        like_lookup = {
+            "author": self.request.user,
+            "content_type_id": content_type_id(model),
+            "object_id": self.kwargs.get("object_id"),
+        }
+
+        with transaction.atomic():
+            # Look the liked object up first, so a like can never point at a
+            # missing row. select_for_update() serializes toggles on the same
+            # object, keeping the count read here exact until the commit.
+            like_count = (
+                model._base_manager.select_for_update()
+                .filter(pk=like_lookup["object_id"])
+                .values_list("likes_count", flat=True)
+                .first()
+            )
+            if like_count is None:
+                raise Http404("No such object to like.")
+
+            # Unlike: the delete count tells whether the like existed. Because Like
+            # has post_delete receivers, Django first SELECTs the matching row,
+            # then DELETEs it, and the receiver UPDATEs the liked object's counter
+            deleted, _ = Like.objects.filter(**like_lookup).delete()
+            liked = not deleted
+
+            if liked:
+                try:
+                    with transaction.atomic():
+                        Like.objects.create(**like_lookup)
+                    like_count += 1
+                except IntegrityError:
+                    # A concurrent request (e.g. a double click) created it first
+                    pass
+            else:
+                # The like_deleted receiver never takes the counter below 0
+                like_count = max(like_count - 1, 0)
 
         return JsonResponse(
             {